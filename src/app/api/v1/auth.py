@@ -34,7 +34,7 @@ async def login(
     """
     Login endpoint to authenticate user credentials and get JWT token.
     """
-    user = await AuthService.authenticate_user_async(
+    user = await AuthService.authenticate_user(
         session=session,
         username=login_data.username,
         password=login_data.password
@@ -47,7 +47,7 @@ async def login(
         )
 
     access_token = AuthService.create_access_token(
-        data={"sub": user.username}
+        data={"sub": user.username, "uid": user.id}
     )
     
     return LoginResponse(
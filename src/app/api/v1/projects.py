@@ -1,11 +1,25 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from enum import Enum
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio.session import AsyncSession
 import uuid
-from app.schemas.projects import ProjectModel, ProjectCreateModel, ProjectUpdateModel
-from app.schemas.tasks import TaskModel, TaskCreateModel
-from app.services.projects import ProjectService
-from app.core.db.database import get_db
+from app.schemas.projects import (
+    ProjectModel, ProjectPageModel, ProjectCreateModel, ProjectUpdateModel, ProjectStatsModel
+)
+from app.schemas.tasks import (
+    TaskModel, TaskFilterModel, TaskPageModel, TaskCreateModel, TaskBulkCreateModel, TaskBulkResultModel
+)
+from app.services.projects import ProjectService, TASK_COLUMNS
+from app.services.purge import get_project_purger
+from app.core.streaming import encode_ndjson, encode_csv, encode_sse
+from app.core.changefeed import get_change_feed
+from app.core.config import settings
+from app.core.responses import RawJSONResponse
+from app.core.conditional import make_etag, etag_matches, not_modified
+from app.core.db.database import get_db, async_session_factory
+from app.core.singleflight import SingleFlight
 from app.models.auth import User
 from app.services.auth import get_current_user_dependency
 
@@ -13,11 +27,53 @@ from app.services.auth import get_current_user_dependency
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
+# Concurrent identical task listing requests in this worker share one query.
+task_page_flight = SingleFlight()
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
 def get_project_service(db: AsyncSession = Depends(get_db)) -> ProjectService:
     """Dependency to get ProjectService instance."""
     return ProjectService(db)
 
 
+async def load_task_page(
+    project_id: uuid.UUID,
+    limit: int,
+    cursor: Optional[str],
+    filters: TaskFilterModel,
+    read_only: bool
+) -> bytes:
+    """Load a task page in a session of its own, so it outlives any one waiting request."""
+    async with async_session_factory() as session:
+        session.info["read_only"] = read_only
+        return await ProjectService(session).get_tasks_for_project(
+            project_id, limit=limit, cursor=cursor, filters=filters)
+
+
+def get_task_filters(
+    completed: Optional[bool] = Query(None, description="Only completed (true) or open (false) tasks"),
+    due_after: Optional[date] = Query(None, description="Only tasks due on or after this date"),
+    due_before: Optional[date] = Query(None, description="Only tasks due on or before this date"),
+    min_priority: Optional[int] = Query(None, description="Only tasks with at least this priority"),
+    max_priority: Optional[int] = Query(None, description="Only tasks with at most this priority"),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Case-insensitive title substring")
+) -> TaskFilterModel:
+    """Dependency collecting the task listing filters from the query string."""
+    return TaskFilterModel(
+        completed=completed,
+        due_after=due_after,
+        due_before=due_before,
+        min_priority=min_priority,
+        max_priority=max_priority,
+        q=q
+    )
+
+
 @router.post(
         "/",
         summary="Create a new project",
@@ -31,22 +87,76 @@ async def create_project(
     return await project_service.create_project(project)
 
 
+@router.get(
+        "/",
+        summary="List projects, oldest first",
+        status_code=200,
+        response_model=ProjectPageModel)
+async def list_projects(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of projects per page"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    with_task_count: bool = Query(False, description="Embed each project's task count"),
+    _current_user: User = Depends(get_current_user_dependency),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    return await project_service.get_projects(
+        limit=limit, cursor=cursor, with_task_count=with_task_count)
+
+
+@router.get(
+        "/stats",
+        summary="Get task counters for many projects at once",
+        status_code=200,
+        response_model=List[ProjectStatsModel])
+async def get_projects_stats(
+    project_id: List[uuid.UUID] = Query(
+        ..., min_length=1, max_length=500, description="Project IDs (repeat the parameter)"),
+    _current_user: User = Depends(get_current_user_dependency),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    # Unknown IDs are omitted rather than failing the whole batch.
+    return await project_service.get_projects_stats(project_id)
+
+
 @router.get(
         "/{project_id}",
         summary="Get project details by ID",
         status_code=200,
-        response_model=ProjectModel)
+        response_model=ProjectModel,
+        responses={304: {"description": "Not modified since the ETag in If-None-Match"}})
 async def get_project_details(
     project_id: uuid.UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     _current_user: User = Depends(get_current_user_dependency),
     project_service: ProjectService = Depends(get_project_service)
 ):
     project = await project_service.get_project_by_id(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    etag = make_etag(project.id, project.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return project
 
 
+@router.get(
+        "/{project_id}/stats",
+        summary="Get task counters for a project",
+        status_code=200,
+        response_model=ProjectStatsModel)
+async def get_project_stats(
+    project_id: uuid.UUID,
+    _current_user: User = Depends(get_current_user_dependency),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    stats = await project_service.get_project_stats(project_id)
+    if not stats:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return stats
+
+
 @router.put(
         "/{project_id}",
         summary="Update project information by ID",
@@ -67,12 +177,24 @@ async def update_project_info(
 @router.delete(
         "/{project_id}",
         summary="Delete a project by ID",
-        status_code=204)
+        status_code=204,
+        responses={202: {"description": "Project hidden; its tasks are being purged in the background"}})
 async def delete_project(
     project_id: uuid.UUID,
+    background: Optional[bool] = Query(
+        None, description="Purge tasks in the background; defaults to true for very large projects"),
     _current_user: User = Depends(get_current_user_dependency),
     project_service: ProjectService = Depends(get_project_service)
 ):
+    if background is None:
+        background = await project_service.should_delete_in_background(project_id)
+
+    if background:
+        if not await project_service.soft_delete_project(project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
+        get_project_purger().wake()
+        return Response(status_code=202)
+
     success = await project_service.delete_project(project_id)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -93,14 +215,108 @@ async def create_task_for_project(
     return await project_service.create_task_for_project(project_id, task)
 
 
+@router.post(
+        "/{project_id}/tasks/bulk",
+        summary="Create many tasks under a specific project",
+        status_code=201,
+        response_model=TaskBulkResultModel)
+async def create_tasks_for_project(
+    project_id: uuid.UUID,
+    payload: TaskBulkCreateModel,
+    _current_user: User = Depends(get_current_user_dependency),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    return await project_service.create_tasks_for_project(project_id, payload.tasks)
+
+
 @router.get(
         "/{project_id}/tasks/",
-        summary="Get all tasks under a specific project",
+        summary="Get tasks under a specific project, sorted by priority",
         status_code=200,
-        response_model=List[TaskModel])
+        response_model=TaskPageModel,
+        responses={304: {"description": "Not modified since the ETag in If-None-Match"}})
 async def get_tasks_for_project(
     project_id: uuid.UUID,
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of tasks per page"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    filters: TaskFilterModel = Depends(get_task_filters),
+    if_none_match: Optional[str] = Header(None),
     _current_user: User = Depends(get_current_user_dependency),
     project_service: ProjectService = Depends(get_project_service)
 ):
-    return await project_service.get_tasks_for_project(project_id)
+    # Any task write bumps the project version, so it identifies every page of the listing.
+    version = await project_service.get_project_version(project_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    etag = make_etag(project_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    # Requests that must read from the primary never share a replica's result.
+    read_only = bool(project_service.db.info.get("read_only"))
+    # The leader loads the page on a connection of its own; give the request's back first.
+    await project_service.db.close()
+    key = ("project_tasks", project_id, version, limit, cursor,
+           filters.model_dump_json(exclude_none=True), read_only)
+    page = await task_page_flight.do(
+        key, lambda: load_task_page(project_id, limit, cursor, filters, read_only))
+    # The page is already TaskPageModel-shaped JSON; response_model only documents it.
+    return RawJSONResponse(content=page, headers={"ETag": etag})
+
+
+@router.get(
+        "/{project_id}/tasks/export",
+        summary="Stream every task under a specific project as NDJSON or CSV",
+        status_code=200,
+        response_class=StreamingResponse,
+        responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}})
+async def export_tasks_for_project(
+    project_id: uuid.UUID,
+    format: ExportFormat = Query(ExportFormat.ndjson, description="Export encoding"),
+    filters: TaskFilterModel = Depends(get_task_filters),
+    _current_user: User = Depends(get_current_user_dependency),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    if not await project_service.project_exists(project_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    batches = project_service.stream_tasks_for_project(project_id, filters=filters)
+    if format == ExportFormat.csv:
+        return StreamingResponse(
+            encode_csv(batches, TASK_COLUMNS),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="tasks-{project_id}.csv"'}
+        )
+    return StreamingResponse(encode_ndjson(batches), media_type="application/x-ndjson")
+
+
+@router.get(
+        "/{project_id}/tasks/events",
+        summary="Stream changes to a project's tasks as Server-Sent Events",
+        status_code=200,
+        response_class=StreamingResponse,
+        responses={200: {"content": {"text/event-stream": {}}}})
+async def stream_task_events(
+    project_id: uuid.UUID,
+    _current_user: User = Depends(get_current_user_dependency),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    if not await project_service.project_exists(project_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+    change_feed = get_change_feed()
+    change_feed.check_capacity()
+    # The stream may stay open for hours; give the request's connection back to the pool.
+    await project_service.db.close()
+
+    async def events():
+        async with change_feed.subscribe(project_id) as subscription:
+            async for event in subscription.events(settings.CHANGEFEED_HEARTBEAT_SECONDS):
+                yield event
+                if event is not None and event.get("op") == "project_deleted":
+                    return
+
+    return StreamingResponse(
+        encode_sse(events()),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -2,7 +2,9 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio.session import AsyncSession
 import uuid
-from app.schemas.tasks import TaskModel, TaskCreateModel, TaskUpdateModel
+from app.schemas.tasks import (
+    TaskModel, TaskCreateModel, TaskUpdateModel, TaskBulkUpdateModel, TaskBulkResultModel
+)
 from app.services.tasks import TaskService
 from app.core.db.database import get_db
 from app.models.auth import User
@@ -17,6 +19,20 @@ def get_task_service(db: AsyncSession = Depends(get_db)) -> TaskService:
     return TaskService(db)
 
 
+# Declared before "/{task_id}" so "bulk" is not parsed as a task ID.
+@router.put(
+        "/bulk",
+        summary="Update many tasks at once",
+        status_code=200,
+        response_model=TaskBulkResultModel)
+async def update_tasks(
+    payload: TaskBulkUpdateModel,
+    _current_user: User = Depends(get_current_user_dependency),
+    task_service: TaskService = Depends(get_task_service)
+):
+    return await task_service.update_tasks(payload.tasks)
+
+
 @router.put(
         "/{task_id}",
         summary="Update a task by ID",
@@ -0,0 +1,171 @@
+"""
+Admission control for the Taller Challenge API.
+
+Requests are admitted against per-worker concurrency budgets (one for reads,
+one for writes, plus optional per-route limits). Requests over budget wait
+in a bounded queue. Once that queue is full, a request has waited too long,
+or database pool checkouts are already slow, new requests get an immediate
+503 with ``Retry-After``, so overload degrades into fast rejections instead
+of every request timing out.
+"""
+import asyncio
+import math
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from starlette.routing import Match
+
+from app.core.metrics import Counter, registry
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+admission_rejections_total = registry.register(Counter(
+    "http_admission_rejections_total",
+    "Requests shed by admission control, by budget and reason.",
+    ("budget", "reason")
+))
+
+
+class ConcurrencyLimit:
+    """A concurrency budget with a bounded, time-limited wait queue."""
+
+    def __init__(self, name: str, limit: int, max_queue: int, max_wait: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> Optional[str]:
+        """
+        Take a slot, waiting in the queue if necessary.
+
+        Returns:
+            None once admitted, otherwise the reason the request was rejected
+        """
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+        else:
+            if self.waiting >= self.max_queue:
+                return "queue_full"
+            self.waiting += 1
+            try:
+                # Unlike wait_for, a timeout cannot discard a permit acquired as it expires.
+                async with asyncio.timeout(self.max_wait):
+                    await self._semaphore.acquire()
+            except TimeoutError:
+                return "queue_timeout"
+            finally:
+                self.waiting -= 1
+        self.active += 1
+        return None
+
+    def release(self) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"active": self.active, "waiting": self.waiting, "limit": self.limit}
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware admitting requests against read/write and per-route budgets.
+
+    Routes are matched by template (``GET /api/v1/projects/{project_id}``)
+    before the request is dispatched. Exempt routes, such as health probes
+    and long-lived event streams, bypass admission entirely.
+    """
+
+    def __init__(
+            self,
+            app: Any,
+            read_limit: int,
+            write_limit: int,
+            max_queue: int,
+            max_queue_wait: float,
+            route_limits: Optional[Mapping[str, int]] = None,
+            exempt_routes: Iterable[str] = (),
+            pool_wait: Optional[Callable[[], float]] = None,
+            max_pool_wait: float = 0.0):
+        self.app = app
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.exempt_routes = frozenset(exempt_routes)
+        self.pool_wait = pool_wait
+        self.max_pool_wait = max_pool_wait
+        self.limits = {
+            "read": ConcurrencyLimit("read", read_limit, max_queue, max_queue_wait),
+            "write": ConcurrencyLimit("write", write_limit, max_queue, max_queue_wait),
+        }
+        self.route_limits = {
+            route: ConcurrencyLimit(route, limit, max_queue, max_queue_wait)
+            for route, limit in (route_limits or {}).items()
+        }
+
+    @staticmethod
+    def _route_template(scope) -> Optional[str]:
+        app = scope.get("app")
+        router = getattr(app, "router", None)
+        for route in getattr(router, "routes", ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+        return None
+
+    @staticmethod
+    async def _reject(send, budget: str, reason: str, retry_after: float) -> None:
+        admission_rejections_total.inc((budget, reason))
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({
+            "type": "http.response.body",
+            "body": b'{"detail":"Server is overloaded, retry later"}',
+        })
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        template = self._route_template(scope)
+        if template in self.exempt_routes or scope["path"] in self.exempt_routes:
+            await self.app(scope, receive, send)
+            return
+
+        budget = "read" if scope["method"] in READ_METHODS else "write"
+        if self.pool_wait is not None and self.max_pool_wait > 0:
+            pool_wait = self.pool_wait()
+            if pool_wait > self.max_pool_wait:
+                await self._reject(send, budget, "pool_wait", pool_wait)
+                return
+
+        # The narrower route limit goes first, so requests queued behind it hold no shared slot.
+        acquired = []
+        try:
+            for limit in (self.route_limits.get(f"{scope['method']} {template}"), self.limits[budget]):
+                if limit is None:
+                    continue
+                reason = await limit.acquire()
+                if reason is not None:
+                    await self._reject(send, limit.name, reason, self.max_queue_wait)
+                    return
+                acquired.append(limit)
+            await self.app(scope, receive, send)
+        finally:
+            for limit in acquired:
+                limit.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Active and waiting requests per budget."""
+        return {
+            name: limit.stats()
+            for name, limit in {**self.limits, **self.route_limits}.items()
+        }
@@ -0,0 +1,163 @@
+"""
+Caching primitives for the Taller Challenge API.
+Provides an in-process TTL/LRU cache and the async, Redis-compatible
+backends used by the service-layer read-through cache.
+"""
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Hashable, Optional
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a time-to-live.
+
+    Entries are evicted least-recently-used first once ``max_size`` is
+    reached, and lazily dropped on access once they have expired.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store ``value`` under ``key``.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl: Optional lifetime in seconds, capped at the cache's own TTL
+        """
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0 or self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + lifetime, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheBackend:
+    """
+    Async key/value interface used by the read-through cache.
+
+    It mirrors the subset of Redis commands the services need (``get``,
+    ``set`` with ``ex``, ``delete``), so a ``redis.asyncio.Redis`` client or
+    any fake with the same methods can be plugged in.
+    """
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+
+class NullCacheBackend(CacheBackend):
+    """Backend that never stores anything; disables caching."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        return None
+
+    async def delete(self, *keys: str) -> None:
+        return None
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU backend with per-entry TTL."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        self._cache.set(key, value, ttl=ex)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.delete(key)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend delegating to a Redis-compatible async client."""
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        await self.client.set(key, value, ex=ex)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+
+@lru_cache()
+def get_cache() -> CacheBackend:
+    """
+    Get the process-wide cache backend selected by ``CACHE_BACKEND``.
+    Using lru_cache to ensure the backend is built only once.
+    """
+    if settings.CACHE_BACKEND == "none":
+        return NullCacheBackend()
+
+    if settings.CACHE_BACKEND == "redis":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+        return RedisCacheBackend(redis.Redis.from_url(settings.CACHE_REDIS_URL))
+
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(
+            max_size=settings.CACHE_MAX_ENTRIES,
+            ttl=settings.CACHE_TTL_SECONDS
+        )
+
+    raise ValueError(f"Unknown cache backend: {settings.CACHE_BACKEND}")
@@ -0,0 +1,216 @@
+"""
+Task change feed for the Taller Challenge API.
+
+Writes publish a small JSON event with ``pg_notify`` inside their own
+transaction, so it is delivered only if they commit. Each worker holds one
+LISTEN connection and fans events out to in-process subscribers keyed by
+project. An idle subscriber is a parked ``queue.get()`` and costs no database
+resources.
+"""
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import asyncpg
+import orjson
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select, func
+
+from app.core.config import settings
+from app.core.db.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Single NOTIFY channel; events carry their project and are routed in-process.
+CHANNEL = "task_changes"
+
+# Sent instead of the backlog to a subscriber that fell behind, and to every
+# subscriber after the LISTEN connection was re-established.
+RESYNC_EVENT = {"op": "resync"}
+
+
+class Subscription:
+    """One subscriber's bounded queue of events for a single project."""
+
+    def __init__(self, project_id: uuid.UUID, max_queue: int):
+        self.project_id = project_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        """Queue an event without ever blocking the dispatcher."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A consumer this far behind refetches instead of being buffered without bound.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def events(self, heartbeat: float) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield events as they arrive, and None after ``heartbeat`` idle seconds."""
+        while True:
+            try:
+                yield await asyncio.wait_for(self.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+
+
+class ChangeFeed:
+    """
+    Per-worker fan-out of task change events.
+
+    The LISTEN connection is opened on the first subscription and reopened
+    with backoff if it drops. Without a DSN (non-PostgreSQL databases)
+    events are only delivered within the publishing process.
+    """
+
+    def __init__(self, dsn: Optional[str], max_queue: int = 100, max_subscribers: int = 10000):
+        self.dsn = dsn
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        self._subscribers: Dict[uuid.UUID, Set[Subscription]] = defaultdict(set)
+        self._subscriber_count = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._subscriber_count
+
+    def check_capacity(self) -> None:
+        """
+        Reject a new subscriber up front when this worker is full.
+
+        Raises:
+            HTTPException: If this worker already serves ``max_subscribers``
+        """
+        if self._subscriber_count >= self.max_subscribers:
+            raise HTTPException(
+                status_code=503,
+                detail="Too many change feed subscribers",
+                headers={"Retry-After": "5"}
+            )
+
+    @asynccontextmanager
+    async def subscribe(self, project_id: uuid.UUID) -> AsyncIterator[Subscription]:
+        """Register a subscriber for a project's task changes for the duration of the block."""
+        subscription = Subscription(project_id, self.max_queue)
+        self._subscribers[project_id].add(subscription)
+        self._subscriber_count += 1
+        self._ensure_listening()
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[project_id]
+            self._subscriber_count -= 1
+
+    def dispatch(self, event: Dict[str, Any]) -> None:
+        """Deliver an event to the subscribers of its project."""
+        try:
+            project_id = uuid.UUID(str(event["project_id"]))
+        except (KeyError, ValueError):
+            logger.warning(f"Dropping malformed change event: {event!r}")
+            return
+        for subscription in list(self._subscribers.get(project_id, ())):
+            subscription.deliver(event)
+
+    def _broadcast(self, event: Dict[str, Any]) -> None:
+        for subscribers in list(self._subscribers.values()):
+            for subscription in list(subscribers):
+                subscription.deliver(event)
+
+    def _on_notify(self, _connection, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            event = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Dropping undecodable change event: {payload!r}")
+            return
+        self.dispatch(event)
+
+    def _ensure_listening(self) -> None:
+        if self.dsn and self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="change-feed-listener")
+
+    async def _listen(self) -> None:
+        delay = 1.0
+        connected_before = False
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _connection: closed.set())
+                await connection.add_listener(CHANNEL, self._on_notify)
+                if connected_before:
+                    # Events published while disconnected are lost.
+                    self._broadcast(RESYNC_EVENT)
+                connected_before = True
+                delay = 1.0
+                await closed.wait()
+                logger.warning("Change feed LISTEN connection closed; reconnecting")
+            except asyncio.CancelledError:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+                raise
+            except Exception as e:
+                logger.error(f"Change feed LISTEN connection failed: {e!r}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    async def publish(self, db: AsyncSession, event: Dict[str, Any]) -> None:
+        """
+        Publish an event within the session's current transaction.
+
+        On PostgreSQL it is delivered to every worker once the transaction
+        commits; elsewhere it is dispatched to this process immediately.
+        """
+        payload = orjson.dumps(event).decode()
+        if db.bind.dialect.name == "postgresql":
+            await db.execute(select(func.pg_notify(CHANNEL, payload)))
+        else:
+            self.dispatch(orjson.loads(payload))
+
+    async def stop(self) -> None:
+        """Close the LISTEN connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_change_feed: Optional[ChangeFeed] = None
+
+
+def get_change_feed() -> ChangeFeed:
+    """Get the process-wide change feed."""
+    global _change_feed
+    if _change_feed is None:
+        dsn = None
+        if engine.dialect.name == "postgresql":
+            dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        _change_feed = ChangeFeed(
+            dsn,
+            max_queue=settings.CHANGEFEED_QUEUE_SIZE,
+            max_subscribers=settings.CHANGEFEED_MAX_SUBSCRIBERS
+        )
+    return _change_feed
+
+
+async def publish_task_change(
+        db: AsyncSession,
+        project_id: Optional[uuid.UUID],
+        op: str,
+        **fields: Any) -> None:
+    """Publish a task change event for ``project_id`` in the caller's transaction."""
+    if project_id is not None:
+        await get_change_feed().publish(db, {"project_id": project_id, "op": op, **fields})
@@ -0,0 +1,33 @@
+"""
+Conditional request helpers for the Taller Challenge API.
+Strong ETags are derived from a resource version, and ``If-None-Match`` is
+compared with the weak comparison RFC 9110 prescribes for it.
+"""
+from typing import Any, Optional
+
+from fastapi import Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the values identifying a representation."""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """A bodyless 304 carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
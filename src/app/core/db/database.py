@@ -1,38 +1,339 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+from typing import Dict, Optional
+from fastapi import Request
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, inspect, make_url, text
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncConnection, AsyncEngine
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlmodel import SQLModel, Session, select
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.selectable import Select
+from sqlmodel import SQLModel, select, insert, delete
 import asyncio
+import hashlib
 import logging
+import math
+import os
 from app.core.config import settings
+from app.core.cache import CacheBackend, MemoryCacheBackend, get_cache
+from app.core.db.pool import InstrumentedAsyncQueuePool, get_pool_stats
+from app.core.db.replicas import ReplicaSet
+from app.core.db.triggers import POSTGRESQL_DDL
 from app.models.projects import Project
 from app.models.tasks import Task
 from app.models.auth import User
+from app.models.stats import ProjectStats
 
 logger = logging.getLogger(__name__)
 
 
 async_database_url = settings.DATABASE_URL
 
-engine: AsyncEngine = create_async_engine(
-    async_database_url,
-    echo=settings.DEBUG,
-    future=True
+# On PostgreSQL each worker's change feed holds one LISTEN connection outside the pool.
+LISTEN_CONNECTIONS = 1 if make_url(async_database_url).get_backend_name() == "postgresql" else 0
+
+
+def _connect_args(url: str) -> dict:
+    """Driver-level connection arguments derived from settings."""
+    if "+asyncpg" not in url:
+        return {}
+
+    connect_args = {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+        }
+    return connect_args
+
+
+def _pool_limits() -> tuple[int, int]:
+    """
+    Per-worker ``(pool_size, max_overflow)``.
+
+    With ``DB_MAX_CONNECTIONS`` set, the budget is split evenly across the
+    worker processes actually running, so that all their pools together
+    never exceed it; a single process gets the whole budget. Each worker's
+    share first sets aside its change feed LISTEN connection.
+    """
+    pool_size, max_overflow = settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    if settings.DB_MAX_CONNECTIONS:
+        per_worker = max(
+            1, settings.DB_MAX_CONNECTIONS // settings.worker_processes - LISTEN_CONNECTIONS)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = min(max_overflow, per_worker - pool_size)
+    return pool_size, max_overflow
+
+
+pool_size, max_overflow = _pool_limits()
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Build an engine with the configured pool and driver settings."""
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args(url)
+    )
+
+
+engine: AsyncEngine = _create_engine(async_database_url)
+
+
+def _replica_urls() -> list[str]:
+    """
+    Replica URLs to route reads to.
+
+    Read-your-writes needs every worker to see every client's recent writes;
+    with several workers that takes the shared Redis backend, and without it
+    replicas are not used at all.
+    """
+    urls = settings.replica_urls
+    if urls and settings.worker_processes > 1 and settings.CACHE_BACKEND != "redis":
+        logger.warning(
+            f"Ignoring DATABASE_REPLICA_URLS: {settings.worker_processes} workers cannot share "
+            "read-your-writes state without CACHE_BACKEND=redis")
+        return []
+    return urls
+
+
+# Optional read replicas; each gets its own pool of the same size.
+replica_set = ReplicaSet(
+    [_create_engine(url) for url in _replica_urls()],
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    interval=settings.REPLICA_CHECK_INTERVAL_SECONDS,
+    timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS
+)
+
+
+def _reset_pool_after_fork() -> None:
+    # A forked child must never reuse the parent's sockets; drop the inherited
+    # pool without closing the parent's connections and start a fresh one.
+    engine.sync_engine.dispose(close=False)
+    for replica in replica_set.replicas:
+        replica.engine.sync_engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+def _recent_writers_backend() -> CacheBackend:
+    """Shared Redis when configured, so every worker sees a client's writes; else this process."""
+    if settings.CACHE_BACKEND == "redis":
+        return get_cache()
+    return MemoryCacheBackend(max_size=10000, ttl=settings.READ_YOUR_WRITES_SECONDS)
+
+
+# Clients (by credentials) that wrote recently; their reads stay on the primary.
+_recent_writers = _recent_writers_backend()
+
+
+def _writer_key(client_key: str) -> str:
+    return "recent_writer:" + hashlib.sha256(client_key.encode()).hexdigest()
+
+
+async def _mark_recent_writer(client_key: str) -> None:
+    await _recent_writers.set(
+        _writer_key(client_key), b"1", ex=math.ceil(settings.READ_YOUR_WRITES_SECONDS))
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain reads to a replica when its unit of work allows it.
+
+    Reads are routed only when ``info["read_only"]`` was set by the caller
+    and nothing has been written through this session yet. Writes, locking
+    reads and every read after a write (read-your-writes) use the primary.
+    A session sticks to the first replica it picks.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+        elif (self.info.get("read_only")
+                and not self.info.get("wrote")
+                and isinstance(clause, Select)
+                and clause._for_update_arg is None):
+            if "replica" not in self.info:
+                self.info["replica"] = replica_set.choose()
+            replica = self.info["replica"]
+            if replica is not None:
+                return replica.sync_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+# Built once; creating a sessionmaker per request was pure overhead.
+async_session_factory = async_sessionmaker(
+    bind=engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession
+)
+
+
+def pool_status() -> dict:
+    """Current primary connection pool gauges and checkout wait counters."""
+    return get_pool_stats(engine.pool)
+
+
+def pool_wait_seconds() -> float:
+    """Recent checkout wait on the primary pool; replica waits are not counted."""
+    return engine.pool.metrics.recent_wait_seconds()
+
+
+def all_pool_status() -> Dict[str, dict]:
+    """Gauges and counters of the primary pool and of every replica pool."""
+    pools = {"primary": pool_status()}
+    for replica in replica_set.replicas:
+        url = replica.engine.url
+        name = f"{url.host}:{url.port or 5432}" if url.host else url.database
+        pools[f"replica:{name}"] = get_pool_stats(replica.engine.pool)
+    return pools
+
+
+# Extensions the PostgreSQL schema depends on (e.g. trigram title search).
+POSTGRESQL_EXTENSIONS = ("pg_trgm",)
+
+# Changes create_all cannot apply to tables that already exist. Each is
+# idempotent, and they run before the trigger DDL.
+POSTGRESQL_MIGRATIONS = (
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP WITH TIME ZONE",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1",
+    # Recreate the tasks -> projects foreign key with ON DELETE CASCADE.
+    """
+    DO $$
+    DECLARE fk_name text;
+    BEGIN
+        FOR fk_name IN
+            SELECT conname FROM pg_constraint
+            WHERE conrelid = 'tasks'::regclass
+              AND confrelid = 'projects'::regclass
+              AND contype = 'f'
+              AND confdeltype <> 'c'
+        LOOP
+            EXECUTE format('ALTER TABLE tasks DROP CONSTRAINT %I', fk_name);
+            ALTER TABLE tasks ADD CONSTRAINT tasks_project_id_fkey
+                FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE;
+        END LOOP;
+    END
+    $$
+    """,
 )
 
+# Arbitrary application-wide key for the schema bootstrap advisory lock.
+SCHEMA_LOCK_KEY = 0x7A11E7C4
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "1234"
+
+# Records the fingerprint of the schema the database was last bootstrapped
+# with. Kept out of SQLModel.metadata so it is not part of the fingerprint.
+schema_version_table = Table(
+    "schema_version",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("applied_at", TIMESTAMP(timezone=True), nullable=False, server_default=func.now()),
+)
+
+
+def schema_fingerprint(dialect) -> str:
+    """Hash of the DDL the models (and triggers) compile to; changes whenever the schema does."""
+    digest = hashlib.sha256()
+    for table in SQLModel.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    if dialect.name == "postgresql":
+        for statement in POSTGRESQL_DDL:
+            digest.update(statement.encode())
+    return digest.hexdigest()
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    """Create every model index that is missing from an existing table."""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+async def _stored_fingerprint(conn: AsyncConnection) -> Optional[str]:
+    """Return the fingerprint recorded in the database, if any."""
+    has_table = await conn.run_sync(
+        lambda sync_conn: inspect(sync_conn).has_table(schema_version_table.name)
+    )
+    if not has_table:
+        return None
+    result = await conn.execute(
+        select(schema_version_table.c.fingerprint).where(schema_version_table.c.id == 1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def ensure_schema() -> bool:
+    """
+    Create the schema unless the database already matches the models.
+
+    The common case (schema up to date) is one cheap lookup and no DDL. When
+    the fingerprint differs, replicas serialize on a transaction-scoped
+    advisory lock and re-check under it, so only the first one runs DDL.
+
+    Returns:
+        True if DDL was run, False if the schema was already current
+    """
+    fingerprint = schema_fingerprint(engine.dialect)
+
+    async with engine.connect() as conn:
+        if await _stored_fingerprint(conn) == fingerprint:
+            return False
+
+    async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        if await _stored_fingerprint(conn) == fingerprint:
+            return False
+
+        if engine.dialect.name == "postgresql":
+            for extension in POSTGRESQL_EXTENSIONS:
+                await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+        await conn.run_sync(SQLModel.metadata.create_all)
+        if engine.dialect.name == "postgresql":
+            for statement in POSTGRESQL_MIGRATIONS:
+                await conn.execute(text(statement))
+        # create_all skips tables that already exist, including their indexes.
+        await conn.run_sync(_create_missing_indexes)
+        if engine.dialect.name == "postgresql":
+            for statement in POSTGRESQL_DDL:
+                await conn.execute(text(statement))
+        await conn.run_sync(schema_version_table.create, checkfirst=True)
+        await conn.execute(delete(schema_version_table))
+        await conn.execute(insert(schema_version_table).values(id=1, fingerprint=fingerprint))
+    return True
+
+
 async def initialize_database() -> None:
-    """Initialize the database connection and create tables with retry logic."""
+    """Bring the schema up to date and create the admin user, with retry logic."""
     max_retries = 5
     retry_delay = 2  # seconds
     
     for attempt in range(max_retries):
         try:
             logger.info(f"Attempting to connect to database (attempt {attempt + 1}/{max_retries})")
-            async with engine.begin() as conn:
-                await conn.run_sync(SQLModel.metadata.create_all)
-                logger.info("Database tables created successfully")
-            
-            # Create admin user after tables are created - I use a separate connection
+            if await ensure_schema():
+                logger.info("Database schema created/updated")
+            else:
+                logger.info("Database schema already up to date")
+
             await create_admin_user()
             logger.info("Database initialization completed successfully")
             return
@@ -47,51 +348,58 @@ async def initialize_database() -> None:
 
 
 async def create_admin_user() -> None:
-    """Create the default admin user."""
+    """
+    Create the default admin user if it does not exist yet.
+
+    Uses the application's async engine. The bcrypt hash is only computed
+    when the user is missing, and concurrent replicas racing on the insert
+    are resolved by the unique username constraint.
+    """
+    from app.services.auth import AuthService
+
+    async with engine.connect() as conn:
+        result = await conn.execute(select(User.id).where(User.username == ADMIN_USERNAME))
+        if result.scalar_one_or_none() is not None:
+            logger.info(f"Admin user already exists: {ADMIN_USERNAME}")
+            return
+
+    hashed_password = await AuthService.hash_password(ADMIN_PASSWORD)
     try:
-        from app.services.auth import AuthService
-
-        await asyncio.sleep(1)
-        
-        # Use synchronous session for user creation
-        from sqlalchemy import create_engine
-        sync_url = settings.DATABASE_URL
-        if 'postgresql+asyncpg://' in sync_url:
-            sync_url = sync_url.replace('postgresql+asyncpg://', 'postgresql://')
-        elif '+asyncpg' in sync_url:
-            sync_url = sync_url.replace('+asyncpg', '')
-        
-        logger.info(f"Creating admin user with database URL: {sync_url[:50]}...")
-        sync_engine = create_engine(sync_url)
-        
-        with Session(sync_engine) as session:
-            existing_user = session.exec(
-                select(User).where(User.username == "admin")
-            ).first()
-            
-            if existing_user:
-                logger.info(f"Admin user already exists: {existing_user.username}")
-                return
-
-            hashed_password = AuthService.hash_password("1234")
-            admin_user = User(
-                username="admin",
-                hashed_password=hashed_password
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(User).values(username=ADMIN_USERNAME, hashed_password=hashed_password)
+            )
+    except IntegrityError:
+        logger.info(f"Admin user was created concurrently: {ADMIN_USERNAME}")
+        return
+    logger.info(f"Admin user created successfully: {ADMIN_USERNAME}")
+
+
+async def get_db(request: Request):
+    """
+    Dependency to get the request's database session.
+
+    FastAPI caches it per request, so every dependency of a request (and the
+    route itself) shares this one session and at most one pooled connection.
+    With replicas configured, GET and HEAD requests read from a replica
+    unless the same client wrote within ``READ_YOUR_WRITES_SECONDS``.
+    """
+    async with async_session_factory() as session:
+        if not replica_set:
+            yield session
+            return
+
+        client_key = request.headers.get("authorization")
+        if request.method in ("GET", "HEAD"):
+            session.info["read_only"] = (
+                client_key is None
+                or await _recent_writers.get(_writer_key(client_key)) is None
             )
-            
-            session.add(admin_user)
-            session.commit()
-            session.refresh(admin_user)
-            
-            logger.info(f"Admin user created successfully: {admin_user.username} (ID: {admin_user.id})")
-    except Exception as e:
-        logger.error(f"Failed to create admin user: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        pass
-
-
-async def get_db():
-    """Dependency to get database session."""
-    async with sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)() as session:
-        yield session
\ No newline at end of file
+        elif client_key is not None:
+            # Marked up front: the code after ``yield`` only runs once the
+            # response has been sent, too late for the client's next read.
+            await _mark_recent_writer(client_key)
+        yield session
+        if client_key is not None and session.info.get("wrote"):
+            # Restart the window now that the write is done.
+            await _mark_recent_writer(client_key)
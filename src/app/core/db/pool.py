@@ -0,0 +1,118 @@
+"""
+Connection pool instrumentation for the Taller Challenge API.
+Tracks checkout wait times, overflow connections and pool timeouts so pool
+starvation is visible instead of guessed at.
+"""
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Weight of the newest checkout in the recent wait average, and how fast that
+# average decays when no checkouts happen (e.g. while load is being shed).
+RECENT_WAIT_WEIGHT = 0.2
+RECENT_WAIT_HALF_LIFE_SECONDS = 5.0
+
+
+class PoolMetrics:
+    """Cumulative checkout counters of one connection pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.overflow_events = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.last_wait_seconds = 0.0
+        self._recent_wait_seconds = 0.0
+        self._recent_wait_at = time.monotonic()
+
+    def recent_wait_seconds(self) -> float:
+        """Exponentially weighted checkout wait, decayed by time since the last checkout."""
+        idle = time.monotonic() - self._recent_wait_at
+        return self._recent_wait_seconds * 0.5 ** (idle / RECENT_WAIT_HALF_LIFE_SECONDS)
+
+    def record_wait(self, seconds: float) -> None:
+        self._recent_wait_seconds = (
+            self.recent_wait_seconds() * (1 - RECENT_WAIT_WEIGHT) + seconds * RECENT_WAIT_WEIGHT
+        )
+        self._recent_wait_at = time.monotonic()
+        self.total_wait_seconds += seconds
+        self.last_wait_seconds = seconds
+        if seconds > self.max_wait_seconds:
+            self.max_wait_seconds = seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "overflow_events": self.overflow_events,
+            "total_wait_seconds": self.total_wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+            "last_wait_seconds": self.last_wait_seconds,
+            "recent_wait_seconds": self.recent_wait_seconds(),
+            "avg_wait_seconds": (
+                self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+            ),
+        }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    ``AsyncAdaptedQueuePool`` that records checkout wait time and overflow.
+
+    Each pool keeps its own ``metrics``, so the primary's numbers never mix
+    with a replica's. They carry over when the engine recreates its pool.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        overflow_before = self._overflow
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            self.metrics.record_wait(time.perf_counter() - started)
+            raise
+
+        self.metrics.checkouts += 1
+        self.metrics.record_wait(time.perf_counter() - started)
+        if self._overflow > overflow_before and self._overflow > 0:
+            self.metrics.overflow_events += 1
+        return connection
+
+
+def get_pool_stats(pool: Any) -> Dict[str, Any]:
+    """
+    Snapshot the current state of a connection pool.
+
+    Args:
+        pool: The engine's pool, e.g. ``engine.pool``
+
+    Returns:
+        Live gauges (size, checked out, overflow) merged with the cumulative
+        wait and overflow counters of an instrumented pool
+    """
+    stats: Dict[str, Any] = {}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats.update(pool.metrics.as_dict())
+    return stats
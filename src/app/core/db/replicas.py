@@ -0,0 +1,139 @@
+"""
+Read replica health and selection for the Taller Challenge API.
+A background task measures each replica's reachability and replication lag;
+reads are only routed to replicas whose last check succeeded recently and
+reported lag within the configured bound.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Seconds of replay lag; 0 on a primary or when everything received is replayed
+# (an idle primary would otherwise look increasingly "behind").
+LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class Replica:
+    """Last observed state of one replica."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.ok = False
+        self.lag: Optional[float] = None
+        self.last_checked: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+
+class ReplicaSet:
+    """
+    Tracks replica health and picks one for read-only sessions.
+
+    ``choose`` returns None when no replica qualifies, in which case reads
+    fall back to the primary.
+    """
+
+    def __init__(
+            self,
+            engines: List[AsyncEngine],
+            max_lag: float = 5.0,
+            interval: float = 2.0,
+            timeout: float = 2.0):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.max_lag = max_lag
+        self.interval = interval
+        self.timeout = timeout
+        self._next = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with replica.engine.connect() as conn:
+                    lag = (await conn.execute(LAG_QUERY)).scalar_one()
+        except Exception as e:
+            if replica.ok:
+                logger.warning(f"Replica {replica.engine.url.host} health check failed: {e!r}")
+            replica.ok = False
+            replica.last_error = repr(e)
+        else:
+            replica.ok = True
+            replica.lag = float(lag)
+            replica.last_error = None
+        replica.last_checked = time.monotonic()
+
+    async def check_once(self) -> None:
+        """Check every replica once, concurrently."""
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    def _usable(self, replica: Replica, now: float) -> bool:
+        return (
+            replica.ok
+            and replica.lag is not None
+            and replica.lag <= self.max_lag
+            and replica.last_checked is not None
+            and now - replica.last_checked <= self.interval * 3 + self.timeout
+        )
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """Round-robin over usable replicas; None if there are none."""
+        now = time.monotonic()
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if self._usable(replica, now):
+                return replica.engine
+        return None
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Per-replica health details for readiness output."""
+        now = time.monotonic()
+        return [
+            {
+                "host": replica.engine.url.host,
+                "usable": self._usable(replica, now),
+                "ok": replica.ok,
+                "lag_seconds": None if replica.lag is None else round(replica.lag, 3),
+                "error": replica.last_error,
+            }
+            for replica in self.replicas
+        ]
+
+    async def _run(self) -> None:
+        while True:
+            await self.check_once()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background replica check loop (no-op without replicas)."""
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="replica-monitor")
+
+    async def stop(self) -> None:
+        """Stop the background replica check loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def dispose(self) -> None:
+        """Close every replica pool."""
+        for replica in self.replicas:
+            await replica.engine.dispose()
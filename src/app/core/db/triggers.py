@@ -0,0 +1,107 @@
+"""
+PostgreSQL trigger DDL installed by the schema bootstrap.
+
+``project_stats`` is kept up to date by statement-level triggers on
+``tasks`` that aggregate their transition tables, so a bulk INSERT, COPY,
+UPDATE or DELETE costs one stats update per affected project rather than
+one per row. Counts are applied as deltas. The maximum open priority grows
+with GREATEST on insert and is re-read after updates and deletes with a
+top-1 probe of the partial open-tasks index.
+"""
+
+PROJECT_STATS_FUNCTION = """
+CREATE OR REPLACE FUNCTION project_stats_on_task_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE project_stats AS s
+        SET task_count = s.task_count - d.task_count,
+            completed_count = s.completed_count - d.completed_count
+        FROM (
+            SELECT project_id,
+                   count(*) AS task_count,
+                   count(*) FILTER (WHERE completed) AS completed_count
+            FROM old_rows
+            WHERE project_id IS NOT NULL
+            GROUP BY project_id
+        ) AS d
+        WHERE s.project_id = d.project_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO project_stats AS s (project_id, task_count, completed_count, max_open_priority)
+        SELECT project_id,
+               count(*),
+               count(*) FILTER (WHERE completed),
+               max(priority) FILTER (WHERE NOT completed)
+        FROM new_rows
+        WHERE project_id IS NOT NULL
+        GROUP BY project_id
+        ON CONFLICT (project_id) DO UPDATE
+        SET task_count = s.task_count + EXCLUDED.task_count,
+            completed_count = s.completed_count + EXCLUDED.completed_count,
+            max_open_priority = GREATEST(s.max_open_priority, EXCLUDED.max_open_priority);
+    END IF;
+
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE project_stats AS s
+        SET max_open_priority = (
+            SELECT t.priority FROM tasks AS t
+            WHERE t.project_id = s.project_id AND t.completed IS false
+            ORDER BY t.priority DESC
+            LIMIT 1
+        )
+        WHERE s.project_id IN (
+            SELECT DISTINCT project_id FROM old_rows WHERE project_id IS NOT NULL
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$
+"""
+
+PROJECT_STATS_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS project_stats_after_insert ON tasks",
+    """
+    CREATE TRIGGER project_stats_after_insert
+    AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_stats_on_task_change()
+    """,
+    "DROP TRIGGER IF EXISTS project_stats_after_update ON tasks",
+    """
+    CREATE TRIGGER project_stats_after_update
+    AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_stats_on_task_change()
+    """,
+    "DROP TRIGGER IF EXISTS project_stats_after_delete ON tasks",
+    """
+    CREATE TRIGGER project_stats_after_delete
+    AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_stats_on_task_change()
+    """,
+]
+
+# Recomputes every counter from scratch. Runs in the same transaction that
+# (re)creates the triggers, which holds a lock blocking concurrent task
+# writes, so the counters start out exact.
+PROJECT_STATS_BACKFILL = """
+INSERT INTO project_stats (project_id, task_count, completed_count, max_open_priority)
+SELECT p.id,
+       count(t.id),
+       count(t.id) FILTER (WHERE t.completed),
+       max(t.priority) FILTER (WHERE NOT t.completed)
+FROM projects AS p
+LEFT JOIN tasks AS t ON t.project_id = p.id
+GROUP BY p.id
+ON CONFLICT (project_id) DO UPDATE
+SET task_count = EXCLUDED.task_count,
+    completed_count = EXCLUDED.completed_count,
+    max_open_priority = EXCLUDED.max_open_priority
+"""
+
+# Statements run, in order, after create_all on PostgreSQL.
+POSTGRESQL_DDL = [PROJECT_STATS_FUNCTION, *PROJECT_STATS_TRIGGERS, PROJECT_STATS_BACKFILL]
@@ -0,0 +1,119 @@
+"""
+Database-aware health monitoring for the Taller Challenge API.
+A background task pings the database on a fixed interval and caches the
+result, so readiness probes are answered from memory and never add DB load.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """
+    Periodically pings the database and reports replica readiness.
+
+    A replica is ready when the last ping succeeded, that ping is recent,
+    and the connection pool is below the configured saturation threshold.
+    """
+
+    def __init__(
+            self,
+            engine: AsyncEngine,
+            pool_stats: Callable[[], Dict[str, Any]],
+            interval: float = 5.0,
+            timeout: float = 2.0,
+            max_saturation: float = 0.9):
+        self.engine = engine
+        self.pool_stats = pool_stats
+        self.interval = interval
+        self.timeout = timeout
+        self.max_saturation = max_saturation
+
+        self.database_ok = False
+        self.last_checked: Optional[float] = None
+        self.last_latency: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def check_once(self) -> None:
+        """Ping the database once and record the outcome."""
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            if self.database_ok:
+                logger.warning(f"Database health check failed: {e!r}")
+            self.database_ok = False
+            self.last_error = repr(e)
+        else:
+            self.database_ok = True
+            self.last_error = None
+        self.last_latency = time.perf_counter() - started
+        self.last_checked = time.monotonic()
+
+    async def _run(self) -> None:
+        while True:
+            await self.check_once()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background health check loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+    async def stop(self) -> None:
+        """Stop the background health check loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def pool_saturation(self) -> float:
+        """Fraction of the pool's maximum connections currently checked out."""
+        stats = self.pool_stats()
+        capacity = stats.get("size", 0) + max(stats.get("max_overflow", 0), 0)
+        if capacity <= 0:
+            return 0.0
+        return stats.get("checked_out", 0) / capacity
+
+    def readiness(self) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Report readiness from cached state only.
+
+        Returns:
+            Whether the replica should receive traffic, and the details behind it
+        """
+        saturation = self.pool_saturation()
+        age = None if self.last_checked is None else time.monotonic() - self.last_checked
+        stale = age is None or age > self.interval * 3 + self.timeout
+
+        reasons = []
+        if not self.database_ok:
+            reasons.append("database unreachable")
+        if stale:
+            reasons.append("health check stale")
+        if saturation >= self.max_saturation:
+            reasons.append("connection pool saturated")
+
+        return not reasons, {
+            "status": "ready" if not reasons else "not ready",
+            "reasons": reasons,
+            "database": {
+                "ok": self.database_ok,
+                "latency_ms": None if self.last_latency is None else round(self.last_latency * 1000, 2),
+                "checked_seconds_ago": None if age is None else round(age, 2),
+                "error": self.last_error,
+            },
+            "pool_saturation": round(saturation, 3),
+        }
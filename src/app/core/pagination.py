@@ -0,0 +1,42 @@
+"""
+Keyset pagination helpers for the Taller Challenge API.
+Cursors are opaque, URL-safe tokens that wrap the sort key of the last row of a page.
+"""
+import base64
+import binascii
+import json
+from typing import Any, List
+
+from fastapi import HTTPException
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode the sort key of the last row of a page into an opaque cursor."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode an opaque cursor back into its sort key values.
+
+    Args:
+        cursor: The cursor returned with the previous page
+        size: The number of values the sort key is expected to have
+
+    Returns:
+        The decoded sort key values
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return values
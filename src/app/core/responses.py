@@ -0,0 +1,19 @@
+"""
+Fast JSON response helpers for the Taller Challenge API.
+Hot list endpoints encode plain rows with orjson and return the bytes as-is,
+skipping FastAPI's response-model validation and jsonable_encoder pass.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+
+def dumps(content: Any) -> bytes:
+    """Encode plain Python data (dicts, lists, UUIDs, dates) to JSON bytes."""
+    return orjson.dumps(content)
+
+
+class RawJSONResponse(Response):
+    """Response whose content is already-encoded JSON bytes."""
+    media_type = "application/json"
@@ -0,0 +1,63 @@
+"""
+Single-flight request coalescing for the Taller Challenge API.
+Concurrent calls with the same key share one in-flight computation and its
+result, so a burst of identical reads costs one query instead of hundreds.
+Nothing is kept once the computation finishes, so results are never stale.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls by key within one event loop.
+
+    The computation runs as its own task, detached from the request that
+    started it: a caller that disconnects or is cancelled never fails the
+    other callers waiting on the same key. The task runs in a copy of the
+    leader's context, so per-request accounting such as SQL time is charged
+    to the leader.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the result of ``fn()``, sharing it with concurrent callers of ``key``.
+
+        Args:
+            key: Identifies calls whose results are interchangeable
+            fn: Starts the computation; only called if none is in flight for ``key``
+
+        Returns:
+            The computation's result (or raises its exception)
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.followers += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away.
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing counters and the number of computations in flight."""
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "followers": self.followers,
+        }
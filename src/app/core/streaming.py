@@ -0,0 +1,50 @@
+"""
+Incremental encoders for streamed exports.
+Rows are encoded one batch at a time, so memory stays flat regardless of
+how many rows the underlying server-side cursor yields.
+"""
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence
+
+
+async def encode_ndjson(
+        batches: AsyncIterator[Sequence[Mapping[str, Any]]]) -> AsyncIterator[bytes]:
+    """Encode batches of row mappings as newline-delimited JSON."""
+    async for batch in batches:
+        yield "".join(
+            json.dumps(dict(row), default=str, separators=(",", ":")) + "\n"
+            for row in batch
+        ).encode()
+
+
+async def encode_csv(
+        batches: AsyncIterator[Sequence[Mapping[str, Any]]],
+        columns: List[str]) -> AsyncIterator[bytes]:
+    """Encode batches of row mappings as CSV with a header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        for row in batch:
+            writer.writerow(["" if row[column] is None else row[column] for column in columns])
+        yield buffer.getvalue().encode()
+
+
+async def encode_sse(
+        events: AsyncIterator[Optional[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """Encode events as Server-Sent Events; None becomes a keep-alive comment."""
+    async for event in events:
+        if event is None:
+            yield b": keep-alive\n\n"
+        else:
+            yield (
+                f"event: {event.get('op', 'message')}\n"
+                f"data: {json.dumps(event, default=str, separators=(',', ':'))}\n\n"
+            ).encode()
@@ -0,0 +1,102 @@
+"""
+JWT verification for the Taller Challenge API.
+Keys and algorithm parameters are resolved once at startup, so verifying a
+token on the request path is a signature check and one JSON parse.
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+from jose import JWTError, jwt
+
+from app.core.config import settings
+
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class TokenVerifier:
+    """
+    Verifies and issues JWTs for one key and algorithm.
+
+    HMAC algorithms are verified natively with a precomputed key; any other
+    algorithm falls back to python-jose. Tokens are interchangeable with the
+    ones python-jose produces and accepts.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, leeway: int = 0):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.leeway = leeway
+        self._key = secret_key.encode()
+        self._digest = _HMAC_DIGESTS.get(algorithm)
+        # Header segments seen before and whether they name our algorithm.
+        self._headers: Dict[str, bool] = {}
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """Sign ``claims`` into a compact JWT."""
+        return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+    def _header_ok(self, segment: str) -> bool:
+        known = self._headers.get(segment)
+        if known is None:
+            try:
+                header = orjson.loads(_b64decode(segment))
+                known = isinstance(header, dict) and header.get("alg") == self.algorithm
+            except (ValueError, binascii.Error):
+                known = False
+            # Bounded: well-behaved clients only ever send a handful of headers.
+            if len(self._headers) < 64:
+                self._headers[segment] = known
+        return known
+
+    def decode(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify ``token`` and return its claims.
+
+        Returns:
+            The claims, or None if the token is malformed, forged or expired
+        """
+        if self._digest is None:
+            try:
+                return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            except JWTError:
+                return None
+
+        header, sep, rest = token.partition(".")
+        payload, sep2, signature = rest.partition(".")
+        if not sep or not sep2 or not self._header_ok(header):
+            return None
+
+        expected = hmac.new(self._key, token[:len(header) + 1 + len(payload)].encode(), self._digest).digest()
+        try:
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                return None
+            claims = orjson.loads(_b64decode(payload))
+        except (ValueError, binascii.Error):
+            return None
+        if not isinstance(claims, dict):
+            return None
+
+        now = time.time()
+        exp = claims.get("exp")
+        if exp is not None and (not isinstance(exp, (int, float)) or exp + self.leeway <= now):
+            return None
+        nbf = claims.get("nbf")
+        if nbf is not None and (not isinstance(nbf, (int, float)) or nbf - self.leeway > now):
+            return None
+        return claims
+
+
+token_verifier = TokenVerifier(settings.SECRET_KEY, settings.JWT_ALGORITHM)
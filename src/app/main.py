@@ -1,13 +1,41 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from app.api.router import api_router
 from contextlib import asynccontextmanager
-from app.core.db.database import initialize_database
+from app.core.config import settings
+from app.core.db.database import (
+    all_pool_status, engine, initialize_database, pool_status, pool_wait_seconds, replica_set
+)
+from app.core.health import HealthMonitor
+from app.core.hashing import password_hasher
+from app.core.metrics import MetricsMiddleware, instrument_engine, register_collector, render_metrics
+from app.core.admission import AdmissionControlMiddleware
+from app.core.changefeed import get_change_feed
+from app.services.purge import get_project_purger
+from app.api.v1.projects import task_page_flight
+
+health_monitor = HealthMonitor(
+    engine,
+    pool_status,
+    interval=settings.HEALTH_CHECK_INTERVAL_SECONDS,
+    timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+    max_saturation=settings.READINESS_MAX_POOL_SATURATION
+)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await initialize_database()
+    health_monitor.start()
+    replica_set.start()
+    get_project_purger().start()
     yield
+    await get_change_feed().stop()
+    await get_project_purger().stop()
+    await replica_set.stop()
+    await replica_set.dispose()
+    await health_monitor.stop()
+    password_hasher.shutdown()
 
 app = FastAPI(
     title="Taller Challenge API",
@@ -17,6 +45,48 @@ app = FastAPI(
 )
 
 app.include_router(api_router)
+if settings.ADMISSION_CONTROL_ENABLED:
+    # Added first so it runs inside MetricsMiddleware, which then counts the 503s it sends.
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        read_limit=settings.ADMISSION_MAX_READS,
+        write_limit=settings.ADMISSION_MAX_WRITES,
+        max_queue=settings.ADMISSION_MAX_QUEUE,
+        max_queue_wait=settings.ADMISSION_MAX_QUEUE_WAIT_SECONDS,
+        route_limits=settings.ADMISSION_ROUTE_LIMITS,
+        exempt_routes=settings.ADMISSION_EXEMPT_ROUTES,
+        pool_wait=pool_wait_seconds,
+        max_pool_wait=settings.ADMISSION_MAX_POOL_WAIT_SECONDS
+    )
+app.add_middleware(MetricsMiddleware, exclude_paths=("/metrics",))
+
+instrument_engine(engine.sync_engine)
+for replica in replica_set.replicas:
+    instrument_engine(replica.engine.sync_engine)
+register_collector(
+    "db_pool", "Connection pool gauges and cumulative checkout counters, by pool.", ("pool", "stat"),
+    lambda: {
+        (pool, stat): value
+        for pool, stats in all_pool_status().items()
+        for stat, value in stats.items()
+    }
+)
+register_collector(
+    "password_hasher", "bcrypt worker pool queue depth and throughput.", ("stat",),
+    lambda: {
+        (stat,): value for stat, value in password_hasher.stats().items()
+        if isinstance(value, (int, float))
+    }
+)
+
+register_collector(
+    "task_page_singleflight", "Coalescing of concurrent identical task listing reads.", ("stat",),
+    lambda: {(stat,): value for stat, value in task_page_flight.stats().items()}
+)
+register_collector(
+    "change_feed", "Change feed subscribers connected to this worker.", ("stat",),
+    lambda: {("subscribers",): get_change_feed().subscriber_count}
+)
 
 @app.get("/")
 async def root():
@@ -25,5 +95,24 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for monitoring."""
+    """Health check endpoint for monitoring (liveness)."""
     return {"status": "healthy"}
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: answered from the cached background database check."""
+    ready, details = health_monitor.readiness()
+    if replica_set:
+        # Informational only: reads fall back to the primary without usable replicas.
+        details["replicas"] = replica_set.status()
+    return JSONResponse(details, status_code=200 if ready else 503)
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of the process's metrics."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -4,5 +4,6 @@ Models package initialization.
 from .projects import Project
 from .tasks import Task
 from .auth import User
+from .stats import ProjectStats
 
-__all__ = ["Project", "Task", "User"]
\ No newline at end of file
+__all__ = ["Project", "Task", "User", "ProjectStats"]
\ No newline at end of file
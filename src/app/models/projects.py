@@ -1,5 +1,6 @@
 from sqlmodel import Column, Field, SQLModel, Relationship
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
+from sqlalchemy import Index, Integer
 from datetime import datetime
 import uuid
 from typing import List, TYPE_CHECKING
@@ -23,9 +24,35 @@ class Project(SQLModel, table=True):
             nullable=False
         )
     )
+    # Bumped by every write to the project or its tasks; backs ETags.
+    version: int = Field(
+        default=1,
+        sa_column=Column(Integer, nullable=False, default=1, server_default="1")
+    )
+    # Set when the project is soft-deleted; its tasks are purged in the background.
+    deleted_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
     
-    # Relationship to tasks
+    # Relationship to tasks; the database cascades deletes, so the ORM never loads them for it
     tasks: List["Task"] = Relationship(
         back_populates="project",
-        cascade_delete=True
-    )
\ No newline at end of file
+        cascade_delete=True,
+        passive_deletes=True
+    )
+
+
+# Keyset pagination of the project listing (ORDER BY created_at, id).
+Index(
+    "ix_projects_created_at_id",
+    Project.__table__.c.created_at,
+    Project.__table__.c.id,
+)
+
+# Lets the background purger find soft-deleted projects without a full scan.
+Index(
+    "ix_projects_deleted_at",
+    Project.__table__.c.deleted_at,
+    postgresql_where=Project.__table__.c.deleted_at.is_not(None),
+)
@@ -0,0 +1,25 @@
+from sqlmodel import Column, Field, SQLModel
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import ForeignKey
+import uuid
+
+
+class ProjectStats(SQLModel, table=True):
+    """
+    Per-project task counters.
+
+    Maintained incrementally by statement-level triggers on ``tasks``
+    (see ``app.core.db.triggers``), so reading them never scans tasks.
+    """
+    __tablename__ = "project_stats"
+
+    project_id: uuid.UUID = Field(
+        sa_column=Column(
+            UUID(as_uuid=True),
+            ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True
+        )
+    )
+    task_count: int = Field(default=0)
+    completed_count: int = Field(default=0)
+    max_open_priority: int | None = Field(default=None)
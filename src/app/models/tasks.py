@@ -1,6 +1,6 @@
 from sqlmodel import Field, SQLModel, Column, Relationship
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
-from sqlalchemy import ForeignKey, Date
+from sqlalchemy import ForeignKey, Date, Index
 from datetime import datetime, date
 import uuid
 from typing import Optional, TYPE_CHECKING
@@ -19,11 +19,46 @@ class Task(SQLModel, table=True):
     priority: int = Field(default=1, description="Task priority (higher number = higher priority)")
     completed: bool = Field(default=False)
     project_id: uuid.UUID | None = Field(
-        sa_column=Column(UUID(as_uuid=True), ForeignKey("projects.id"))
+        sa_column=Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"))
     )
     due_date: date | None = Field(
         sa_column=Column(Date)
     )
     
     # Relationship to project
-    project: Optional["Project"] = Relationship(back_populates="tasks")
\ No newline at end of file
+    project: Optional["Project"] = Relationship(back_populates="tasks")
+
+
+# Composite index backing the keyset-paginated task listing
+# (WHERE project_id = ? ORDER BY priority DESC, id).
+Index(
+    "ix_tasks_project_id_priority_id",
+    Task.__table__.c.project_id,
+    Task.__table__.c.priority.desc(),
+    Task.__table__.c.id,
+)
+
+# Partial index for the dominant dashboard query: open tasks by priority.
+Index(
+    "ix_tasks_open_project_id_priority_id",
+    Task.__table__.c.project_id,
+    Task.__table__.c.priority.desc(),
+    Task.__table__.c.id,
+    postgresql_where=Task.__table__.c.completed.is_(False),
+)
+
+# Due-date range filters within a project.
+Index(
+    "ix_tasks_project_id_due_date",
+    Task.__table__.c.project_id,
+    Task.__table__.c.due_date,
+)
+
+# Trigram index serving case-insensitive substring search on titles
+# (requires the pg_trgm extension, installed by the schema bootstrap).
+Index(
+    "ix_tasks_title_trgm",
+    Task.__table__.c.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
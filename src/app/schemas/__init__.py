@@ -1,12 +1,22 @@
 """
 Schemas package initialization.
 """
-from .projects import ProjectModel, ProjectCreateModel, ProjectUpdateModel
-from .tasks import TaskModel, TaskCreateModel, TaskUpdateModel
+from .projects import (
+    ProjectModel, ProjectListItemModel, ProjectPageModel, ProjectCreateModel,
+    ProjectUpdateModel, ProjectStatsModel
+)
+from .tasks import (
+    TaskModel, TaskFilterModel, TaskPageModel, TaskCreateModel, TaskUpdateModel,
+    TaskBulkCreateModel, TaskBulkUpdateModel, TaskBulkUpdateItemModel,
+    TaskBulkErrorModel, TaskBulkResultModel
+)
 from .auth import UserResponse, LoginRequest, LoginResponse
 
 __all__ = [
-    "ProjectModel", "ProjectCreateModel", "ProjectUpdateModel",
-    "TaskModel", "TaskCreateModel", "TaskUpdateModel",
+    "ProjectModel", "ProjectListItemModel", "ProjectPageModel", "ProjectCreateModel",
+    "ProjectUpdateModel", "ProjectStatsModel",
+    "TaskModel", "TaskFilterModel", "TaskPageModel", "TaskCreateModel", "TaskUpdateModel",
+    "TaskBulkCreateModel", "TaskBulkUpdateModel", "TaskBulkUpdateItemModel",
+    "TaskBulkErrorModel", "TaskBulkResultModel",
     "UserResponse", "LoginRequest", "LoginResponse"
 ]
\ No newline at end of file
@@ -9,6 +9,17 @@ class ProjectModel(BaseModel):
     name: str
     description: Optional[str] = None
     created_at: datetime
+    version: int
+
+    class Config:
+        from_attributes = True
+
+class ProjectListItemModel(ProjectModel):
+    task_count: Optional[int] = None
+
+class ProjectPageModel(BaseModel):
+    items: List[ProjectListItemModel]
+    next_cursor: Optional[str] = None
 
 class ProjectCreateModel(BaseModel):
     name: str
@@ -17,3 +28,10 @@ class ProjectCreateModel(BaseModel):
 class ProjectUpdateModel(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
+
+class ProjectStatsModel(BaseModel):
+    project_id: uuid.UUID
+    task_count: int = 0
+    completed_count: int = 0
+    open_count: int = 0
+    max_open_priority: Optional[int] = None
@@ -1,6 +1,6 @@
 
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
 from datetime import datetime, date
 import uuid
 
@@ -13,6 +13,21 @@ class TaskModel(BaseModel):
     project_id: Optional[uuid.UUID] = None
     due_date: Optional[date] = None
 
+    class Config:
+        from_attributes = True
+
+class TaskFilterModel(BaseModel):
+    completed: Optional[bool] = None
+    due_after: Optional[date] = None
+    due_before: Optional[date] = None
+    min_priority: Optional[int] = None
+    max_priority: Optional[int] = None
+    q: Optional[str] = None
+
+class TaskPageModel(BaseModel):
+    items: List[TaskModel]
+    next_cursor: Optional[str] = None
+
 class TaskCreateModel(BaseModel):
     title: str
     priority: int = 1
@@ -26,3 +41,23 @@ class TaskUpdateModel(BaseModel):
     completed: Optional[bool] = None
     project_id: Optional[uuid.UUID] = None
     due_date: Optional[date] = None
+
+class TaskBulkUpdateItemModel(TaskUpdateModel):
+    id: uuid.UUID
+
+class TaskBulkCreateModel(BaseModel):
+    tasks: List[Dict[str, Any]] = Field(
+        description="Tasks to create, each shaped like TaskCreateModel; invalid items are reported, not fatal")
+
+class TaskBulkUpdateModel(BaseModel):
+    tasks: List[Dict[str, Any]] = Field(
+        description="Task updates, each shaped like TaskUpdateModel plus the task `id`; invalid items are reported, not fatal")
+
+class TaskBulkErrorModel(BaseModel):
+    index: int
+    detail: Any
+
+class TaskBulkResultModel(BaseModel):
+    processed: int
+    ids: List[uuid.UUID]
+    errors: List[TaskBulkErrorModel]
@@ -0,0 +1,53 @@
+"""
+Production entry point for the Taller Challenge API.
+
+Runs the app under uvicorn's process supervisor with ``WEB_CONCURRENCY``
+worker processes. Workers are spawned (not forked from a process holding
+open connections), so each one imports the app and builds its own engine
+and pool; the pool is sized per worker so the whole container stays within
+``DB_MAX_CONNECTIONS``. On SIGTERM workers stop accepting connections,
+finish in-flight requests for up to ``WORKER_GRACEFUL_TIMEOUT`` seconds and
+then run the lifespan shutdown.
+
+The memory cache is private to each process, so a write through one worker
+would leave the others serving stale reads and ETags until their entries
+expire. With more than one worker it is therefore replaced by ``none``;
+share a cache between workers with ``CACHE_BACKEND=redis``.
+
+Usage:
+    python -m app.server
+"""
+import logging
+import os
+
+import uvicorn
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    workers = settings.web_concurrency
+    # Workers are spawned and read their settings from the inherited environment;
+    # the resolved count tells each one how many processes share the instance.
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    if workers > 1 and settings.CACHE_BACKEND == "memory":
+        logger.warning(
+            f"The memory cache is per process; disabling it for {workers} "
+            "workers (set CACHE_BACKEND=redis to share a cache between them)")
+        os.environ["CACHE_BACKEND"] = "none"
+    uvicorn.run(
+        "app.main:app",
+        host=settings.WEB_HOST,
+        port=settings.WEB_PORT,
+        workers=workers,
+        timeout_graceful_shutdown=settings.WORKER_GRACEFUL_TIMEOUT,
+        timeout_keep_alive=settings.WEB_KEEP_ALIVE,
+        proxy_headers=True,
+        access_log=settings.DEBUG,
+    )
+
+
+if __name__ == "__main__":
+    main()
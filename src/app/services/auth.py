@@ -1,19 +1,30 @@
 """
 Authentication service for the Taller Challenge API.
 Handles password hashing, verification, JWT tokens, and authentication.
+Everything that touches the database or bcrypt is async.
 """
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Union
-from passlib.context import CryptContext
-from jose import JWTError, jwt
-from sqlmodel import Session, select
+from typing import Optional
+from sqlmodel import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.models.auth import User
 from app.core.config import settings
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.cache import TTLCache
+from app.core.db.database import get_db
+from app.core.hashing import password_hasher
+from app.core.metrics import current_timings
+from app.core.tokens import token_verifier
+
+# Verified token -> resolved user, per worker. Entries never outlive the token's
+# own expiry, and AUTH_CACHE_TTL_SECONDS bounds how long a changed or removed
+# user is still served from here.
+_user_cache = TTLCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
 
 # Bearer token security scheme with description for Swagger UI
 security = HTTPBearer(
@@ -26,62 +37,24 @@ class AuthService:
     """Service for handling authentication operations."""
     
     @staticmethod
-    def hash_password(password: str) -> str:
-        """Hash a password using bcrypt."""
-        return pwd_context.hash(password)
-    
-    @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
-        return pwd_context.verify(plain_password, hashed_password)
-    
-    @staticmethod
-    def create_admin_user(session: Session) -> User:
-        """
-        Create the default admin user with username 'admin' and password '1234'.
-        """
-        existing_user = session.exec(
-            select(User).where(User.username == "admin")
-        ).first()
-        
-        if existing_user:
-            return existing_user
-
-        hashed_password = AuthService.hash_password("1234")
-        admin_user = User(
-            username="admin",
-            hashed_password=hashed_password
-        )
-
-        session.add(admin_user)
-        session.commit()
-        session.refresh(admin_user)
-
-        return admin_user
+    async def hash_password(password: str) -> str:
+        """Hash a password using bcrypt on the password hashing pool."""
+        return await password_hasher.hash(password)
 
     @staticmethod
-    def authenticate_user(session: Session, username: str, password: str) -> Optional[User]:
-        """Authenticate a user by username and password."""
-        user = session.exec(
-            select(User).where(User.username == username)
-        ).first()
-
-        if not user or not AuthService.verify_password(password, user.hashed_password):
-            return None
-
-        return user
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash on the password hashing pool."""
+        return await password_hasher.verify(plain_password, hashed_password)
 
     @staticmethod
-    async def authenticate_user_async(session, username: str, password: str) -> Optional[User]:
-        """Authenticate a user by username and password (async version)."""
-        from sqlalchemy import select as sql_select
-
+    async def authenticate_user(session: AsyncSession, username: str, password: str) -> Optional[User]:
+        """Authenticate a user by username and password."""
         result = await session.execute(
-            sql_select(User).where(User.username == username)
+            select(User).where(User.username == username)
         )
         user = result.scalar_one_or_none()
 
-        if not user or not AuthService.verify_password(password, user.hashed_password):
+        if not user or not await AuthService.verify_password(password, user.hashed_password):
             return None
 
         return user
@@ -96,22 +69,27 @@ class AuthService:
             expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-        return encoded_jwt
+        return token_verifier.encode(to_encode)
 
     @staticmethod
     def verify_token(token: str) -> Optional[dict]:
         """Verify and decode JWT token."""
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-            return payload
-        except JWTError:
-            return None
+        return token_verifier.decode(token)
 
     @staticmethod
-    async def get_current_user(session, token: str) -> Optional[User]:
-        """Get current user from JWT token."""
-        from sqlalchemy import select as sql_select
+    async def get_current_user(session: AsyncSession, token: str) -> Optional[User]:
+        """
+        Get current user from JWT token.
+
+        Resolved users are cached per token until the earlier of the cache TTL
+        and the token's ``exp`` claim, so repeated requests with the same token
+        skip verification and the user lookup. With ``AUTH_STATELESS`` the
+        signed ``uid`` and ``sub`` claims are trusted as-is and a cache miss
+        never queries the database.
+        """
+        cached_user = _user_cache.get(token)
+        if cached_user is not None:
+            return cached_user
 
         payload = AuthService.verify_token(token)
         if not payload:
@@ -121,19 +99,36 @@ class AuthService:
         if not username:
             return None
 
+        expires_in = payload.get("exp", 0) - time.time()
+        user_id = payload.get("uid")
+        if settings.AUTH_STATELESS and isinstance(user_id, int):
+            # Never persisted and carries no password hash, so it is cached as is.
+            user = User(id=user_id, username=username, hashed_password="")
+            _user_cache.set(token, user, ttl=expires_in)
+            return user
+
         result = await session.execute(
-            sql_select(User).where(User.username == username)
+            select(User).where(User.username == username)
         )
         user = result.scalar_one_or_none()
+
+        if user:
+            _user_cache.set(
+                token,
+                User(id=user.id, username=user.username, hashed_password=user.hashed_password),
+                ttl=expires_in
+            )
         return user
 
 
 async def get_current_user_dependency(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_db)
 ) -> User:
     """
     Dependency to get current authenticated user from JWT token.
     This will be used to protect endpoints.
+    It shares the request's database session with the route's other dependencies.
     """
     if not credentials:
         raise HTTPException(
@@ -142,20 +137,15 @@ async def get_current_user_dependency(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # I import here to avoid circular imports
-    from app.core.db.database import get_db
-
-    async for session in get_db():
-        user = await AuthService.get_current_user(session, credentials.credentials)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return user
-
-    raise HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Database connection error"
-    )
\ No newline at end of file
+    started = time.perf_counter()
+    user = await AuthService.get_current_user(session, credentials.credentials)
+    timings = current_timings()
+    if timings is not None:
+        timings.auth_seconds += time.perf_counter() - started
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
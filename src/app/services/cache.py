@@ -0,0 +1,88 @@
+"""
+Read-through cache for project and task reads.
+
+Every key of a project embeds that project's current generation token, so a
+single write invalidates its details and every cached task page at once by
+rotating the token. Entries written under an old token are never read again
+and simply age out. Lookups return the key they used, and callers store the
+value they then read from the database under that same key: a write that
+rotates the token in between leaves the entry unreachable instead of
+publishing pre-write data under the new token.
+"""
+import uuid
+from typing import Any, Optional, Tuple
+
+from app.core.cache import CacheBackend, get_cache
+from app.core.config import settings
+from app.schemas.projects import ProjectModel
+
+
+class ServiceCache:
+    """Typed cache accessors and invalidation used by the service layer."""
+
+    def __init__(self, backend: CacheBackend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def _generation_key(project_id: uuid.UUID) -> str:
+        return f"project:{project_id}:gen"
+
+    async def _generation(self, project_id: uuid.UUID) -> str:
+        """Return the project's generation token, creating one if missing."""
+        key = self._generation_key(project_id)
+        generation = await self.backend.get(key)
+        if generation is None:
+            generation = uuid.uuid4().hex.encode()
+            await self.backend.set(key, generation, ex=self.ttl)
+        return generation.decode()
+
+    async def _project_key(self, project_id: uuid.UUID) -> str:
+        generation = await self._generation(project_id)
+        return f"project:{project_id}:{generation}"
+
+    async def _task_page_key(self, project_id: uuid.UUID, *params: Any) -> str:
+        generation = await self._generation(project_id)
+        suffix = ":".join("" if param is None else str(param) for param in params)
+        return f"project:{project_id}:{generation}:tasks:{suffix}"
+
+    async def get_project(self, project_id: uuid.UUID) -> Tuple[Optional[ProjectModel], str]:
+        """Return the cached details of a project, if any, and the key to cache them under."""
+        key = await self._project_key(project_id)
+        raw = await self.backend.get(key)
+        if raw is None:
+            return None, key
+        return ProjectModel.model_validate_json(raw), key
+
+    async def set_project(self, key: str, project: ProjectModel) -> None:
+        """Cache the details of a project under the key ``get_project`` returned."""
+        await self.backend.set(key, project.model_dump_json().encode(), ex=self.ttl)
+
+    async def get_task_page(self, project_id: uuid.UUID, *params: Any) -> Tuple[Optional[bytes], str]:
+        """Return a cached, JSON-encoded task page, if any, and the key to cache it under."""
+        key = await self._task_page_key(project_id, *params)
+        return await self.backend.get(key), key
+
+    async def set_task_page(self, key: str, page: bytes) -> None:
+        """Cache a JSON-encoded task page under the key ``get_task_page`` returned."""
+        await self.backend.set(key, page, ex=self.ttl)
+
+    async def invalidate_project(self, *project_ids: Optional[uuid.UUID]) -> None:
+        """Invalidate the details and task listings of the given projects."""
+        for project_id in {project_id for project_id in project_ids if project_id is not None}:
+            await self.backend.set(
+                self._generation_key(project_id),
+                uuid.uuid4().hex.encode(),
+                ex=self.ttl
+            )
+
+
+_service_cache: Optional[ServiceCache] = None
+
+
+def get_service_cache() -> ServiceCache:
+    """Get the process-wide service cache."""
+    global _service_cache
+    if _service_cache is None:
+        _service_cache = ServiceCache(get_cache(), settings.CACHE_TTL_SECONDS)
+    return _service_cache
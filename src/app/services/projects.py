@@ -1,21 +1,52 @@
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
 import uuid
 from datetime import datetime
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlmodel import select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, insert, update, delete, func, or_, and_
 from fastapi import HTTPException
+from pydantic import ValidationError
 
 from app.models.projects import Project
 from app.models.tasks import Task
-from app.schemas.projects import ProjectCreateModel, ProjectUpdateModel
-from app.schemas.tasks import TaskCreateModel
+from app.models.stats import ProjectStats
+from app.schemas.projects import (
+    ProjectModel, ProjectListItemModel, ProjectPageModel, ProjectCreateModel,
+    ProjectUpdateModel, ProjectStatsModel
+)
+from app.schemas.tasks import (
+    TaskCreateModel, TaskFilterModel, TaskBulkErrorModel, TaskBulkResultModel
+)
+from app.core.config import settings
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.responses import dumps
+from app.core.changefeed import publish_task_change
+from app.services.cache import ServiceCache, get_service_cache
+
+# Column order used by the COPY fast path of bulk task creation.
+TASK_COPY_COLUMNS = ("id", "title", "priority", "completed", "project_id", "due_date")
+
+# Columns, in ``TaskModel`` field order, emitted by task listings and exports.
+TASK_COLUMNS = ["id", "title", "priority", "completed", "project_id", "due_date"]
+
+
+async def bump_project_versions(db: AsyncSession, *project_ids: Optional[uuid.UUID]) -> None:
+    """Increment the version of the given projects within the caller's transaction."""
+    # Sorted so concurrent multi-project writes lock rows in the same order.
+    ids = sorted({project_id for project_id in project_ids if project_id is not None})
+    if ids:
+        await db.execute(
+            update(Project).where(Project.id.in_(ids)).values(
+                version=Project.version + 1
+            ).execution_options(synchronize_session=False))
 
 
 class ProjectService:
     """Service layer for project operations."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: Optional[ServiceCache] = None):
         self.db = db
+        self.cache = cache or get_service_cache()
 
     async def create_project(
             self,
@@ -32,23 +63,21 @@ class ProjectService:
         Raises:
             Exception: If project creation fails
         """
-        project = Project(
+        statement = insert(Project).values(
             name=project_data.name,
             description=project_data.description
-        )
-
-        self.db.add(project)
+        ).returning(Project)
+        result = await self.db.execute(statement)
+        project = result.scalar_one()
 
         await self.db.commit()
 
-        await self.db.refresh(project)
-
         return project
 
     async def get_project_by_id(
-            self, project_id: uuid.UUID) -> Optional[Project]:
+            self, project_id: uuid.UUID) -> Optional[ProjectModel]:
         """
-        Retrieve a project by its ID.
+        Retrieve a project by its ID, reading through the cache.
 
         Args:
             project_id: The unique identifier of the project
@@ -56,22 +85,90 @@ class ProjectService:
         Returns:
             The project if found, None otherwise
         """
-        statement = select(Project).where(Project.id == project_id)
+        cached_project, cache_key = await self.cache.get_project(project_id)
+        if cached_project is not None:
+            return cached_project
+
+        statement = select(Project).where(
+            Project.id == project_id, Project.deleted_at.is_(None))
         result = await self.db.execute(statement)
         project = result.scalar_one_or_none()
-        return project
+        if not project:
+            return None
 
-    async def get_all_projects(self) -> List[Project]:
+        project_model = ProjectModel.model_validate(project)
+        if self._read_from_primary():
+            await self.cache.set_project(cache_key, project_model)
+        return project_model
+
+    async def get_projects(
+            self,
+            limit: int = 50,
+            cursor: Optional[str] = None,
+            with_task_count: bool = False) -> ProjectPageModel:
         """
-        Retrieve all projects.
+        Get a page of projects, oldest first.
+
+        Pages are addressed with an opaque ``(created_at, id)`` cursor, so
+        every page is a bounded range scan on ``ix_projects_created_at_id``.
+        Task counts, when requested, come from the trigger-maintained
+        ``project_stats`` counters joined into the same query.
+
+        Args:
+            limit: Maximum number of projects to return
+            cursor: The ``next_cursor`` of the previous page, if any
+            with_task_count: Whether to embed each project's task count
 
         Returns:
-            List of all projects
+            The page of projects and the cursor of the next page
+
+        Raises:
+            HTTPException: If the cursor is invalid
         """
-        statement = select(Project)
+        columns = [Project.id, Project.name, Project.description, Project.created_at, Project.version]
+        if with_task_count:
+            statement = select(*columns, ProjectStats.task_count).outerjoin(
+                ProjectStats, ProjectStats.project_id == Project.id)
+        else:
+            statement = select(*columns)
+        statement = statement.where(Project.deleted_at.is_(None))
+        if cursor:
+            last_created_at, last_id = self._decode_project_cursor(cursor)
+            statement = statement.where(
+                or_(
+                    Project.created_at > last_created_at,
+                    and_(Project.created_at == last_created_at, Project.id > last_id)
+                )
+            )
+        statement = statement.order_by(
+            Project.created_at, Project.id).limit(limit + 1)
+
         result = await self.db.execute(statement)
-        projects_list = result.scalars().all()
-        return list(projects_list)
+        rows = result.mappings().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_project = rows[-1]
+            next_cursor = encode_cursor(
+                [last_project["created_at"].isoformat(), str(last_project["id"])])
+
+        items = []
+        for row in rows:
+            item = ProjectListItemModel.model_validate(dict(row))
+            if with_task_count:
+                item.task_count = row["task_count"] or 0
+            items.append(item)
+        return ProjectPageModel(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _decode_project_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        """Decode a project listing cursor into its ``(created_at, id)`` sort key."""
+        created_at, project_id = decode_cursor(cursor, 2)
+        try:
+            return datetime.fromisoformat(str(created_at)), uuid.UUID(str(project_id))
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
     async def update_project(
             self,
@@ -90,20 +187,23 @@ class ProjectService:
         Raises:
             Exception: If project update fails
         """
-        statement = select(Project).where(Project.id == project_id)
+        values = project_data.model_dump(exclude_none=True)
+        if not values:
+            return await self.get_project_by_id(project_id)
+
+        statement = update(Project).where(
+            Project.id == project_id, Project.deleted_at.is_(None)).values(
+            **values, version=Project.version + 1).returning(
+            Project).execution_options(populate_existing=True)
         result = await self.db.execute(statement)
         project = result.scalar_one_or_none()
 
         if not project:
+            await self.db.rollback()
             return None
 
-        if project_data.name is not None:
-            project.name = project_data.name
-        if project_data.description is not None:
-            project.description = project_data.description
-
         await self.db.commit()
-        await self.db.refresh(project)
+        await self.cache.invalidate_project(project_id)
 
         return project
 
@@ -111,6 +211,9 @@ class ProjectService:
         """
         Delete a project by its ID.
 
+        Its tasks are removed by the database's ``ON DELETE CASCADE`` within
+        the same statement; none are loaded into the session.
+
         Args:
             project_id: The unique identifier of the project
 
@@ -120,21 +223,63 @@ class ProjectService:
         Raises:
             Exception: If project deletion fails
         """
-        statement = select(Project).where(Project.id == project_id)
-        result = await self.db.execute(statement)
-        project = result.scalar_one_or_none()
+        result = await self.db.execute(
+            delete(Project).where(
+                Project.id == project_id, Project.deleted_at.is_(None)
+            ).returning(Project.id))
+        deleted_id = result.scalar_one_or_none()
+        if deleted_id is not None:
+            await publish_task_change(self.db, project_id, "project_deleted")
 
-        if not project:
-            return False
+        await self.db.commit()
+        await self.cache.invalidate_project(project_id)
+
+        return deleted_id is not None
+
+    async def soft_delete_project(self, project_id: uuid.UUID) -> bool:
+        """
+        Mark a project as deleted and leave its tasks to the background purger.
+
+        The project disappears from every read immediately; the request
+        costs one single-row update regardless of how many tasks it has.
+
+        Args:
+            project_id: The unique identifier of the project
+
+        Returns:
+            True if project was marked deleted, False if not found
+        """
+        result = await self.db.execute(
+            update(Project).where(
+                Project.id == project_id, Project.deleted_at.is_(None)
+            ).values(deleted_at=func.now()).returning(Project.id))
+        deleted_id = result.scalar_one_or_none()
+        if deleted_id is not None:
+            await publish_task_change(self.db, project_id, "project_deleted")
 
-        await self.db.delete(project)
         await self.db.commit()
+        await self.cache.invalidate_project(project_id)
+
+        return deleted_id is not None
+
+    async def should_delete_in_background(self, project_id: uuid.UUID) -> bool:
+        """
+        Whether a project is large enough to be soft-deleted and purged later.
+
+        Args:
+            project_id: The unique identifier of the project
 
-        return True
+        Returns:
+            True if the project has at least ``PROJECT_BACKGROUND_DELETE_THRESHOLD`` tasks
+        """
+        result = await self.db.execute(
+            select(ProjectStats.task_count).where(ProjectStats.project_id == project_id))
+        task_count = result.scalar_one_or_none() or 0
+        return task_count >= settings.PROJECT_BACKGROUND_DELETE_THRESHOLD
 
     async def project_exists(self, project_id: uuid.UUID) -> bool:
         """
-        Check if a project exists by its ID.
+        Check if a project exists by its ID, reading through the cache.
 
         Args:
             project_id: The unique identifier of the project
@@ -142,10 +287,75 @@ class ProjectService:
         Returns:
             True if project exists, False otherwise
         """
-        statement = select(Project).where(Project.id == project_id)
+        return await self.get_project_by_id(project_id) is not None
+
+    async def get_projects_stats(
+            self, project_ids: Sequence[uuid.UUID]) -> List[ProjectStatsModel]:
+        """
+        Retrieve task counters for several projects with one primary-key lookup.
+
+        The counters are maintained by triggers on ``tasks``; a project
+        without a counters row simply has no tasks yet.
+
+        Args:
+            project_ids: The unique identifiers of the projects
+
+        Returns:
+            Stats for each existing project, in the order requested
+        """
+        unique_ids = list(dict.fromkeys(project_ids))
+        if not unique_ids:
+            return []
+
+        statement = select(
+            Project.id,
+            ProjectStats.task_count,
+            ProjectStats.completed_count,
+            ProjectStats.max_open_priority
+        ).outerjoin(
+            ProjectStats, ProjectStats.project_id == Project.id
+        ).where(Project.id.in_(unique_ids), Project.deleted_at.is_(None))
         result = await self.db.execute(statement)
-        project = result.scalar_one_or_none()
-        return project is not None
+
+        stats = {}
+        for project_id, task_count, completed_count, max_open_priority in result.all():
+            task_count = task_count or 0
+            completed_count = completed_count or 0
+            stats[project_id] = ProjectStatsModel(
+                project_id=project_id,
+                task_count=task_count,
+                completed_count=completed_count,
+                open_count=task_count - completed_count,
+                max_open_priority=max_open_priority
+            )
+        return [stats[project_id] for project_id in unique_ids if project_id in stats]
+
+    async def get_project_stats(
+            self, project_id: uuid.UUID) -> Optional[ProjectStatsModel]:
+        """
+        Retrieve task counters for a single project.
+
+        Args:
+            project_id: The unique identifier of the project
+
+        Returns:
+            The project's stats if the project exists, None otherwise
+        """
+        stats = await self.get_projects_stats([project_id])
+        return stats[0] if stats else None
+
+    async def get_project_version(self, project_id: uuid.UUID) -> Optional[int]:
+        """
+        Return a project's current version, reading through the cache.
+
+        Args:
+            project_id: The unique identifier of the project
+
+        Returns:
+            The version if the project exists, None otherwise
+        """
+        project = await self.get_project_by_id(project_id)
+        return project.version if project else None
 
     async def create_task_for_project(
             self,
@@ -164,46 +374,244 @@ class ProjectService:
         Raises:
             HTTPException: If project not found
         """
-        project = await self.get_project_by_id(project_id)
-        if not project:
+        if not await self.project_exists(project_id):
             raise HTTPException(status_code=404, detail="Project not found")
 
-        task = Task(
+        statement = insert(Task).values(
             title=task_data.title,
             priority=task_data.priority,
             completed=task_data.completed,
             project_id=project_id,
             due_date=task_data.due_date
-        )
+        ).returning(Task)
 
-        self.db.add(task)
+        try:
+            result = await self.db.execute(statement)
+        except IntegrityError:
+            # The only constraint on tasks is the project foreign key.
+            await self.db.rollback()
+            raise HTTPException(status_code=404, detail="Project not found")
+        task = result.scalar_one()
+        await bump_project_versions(self.db, project_id)
+        await publish_task_change(self.db, project_id, "created", task_id=task.id)
 
         await self.db.commit()
-
-        await self.db.refresh(task)
+        await self.cache.invalidate_project(project_id)
 
         return task
 
-    async def get_tasks_for_project(self, project_id: uuid.UUID) -> List[Task]:
+    async def create_tasks_for_project(
+            self,
+            project_id: uuid.UUID,
+            items: List[Dict[str, Any]]) -> TaskBulkResultModel:
         """
-        Get all tasks under a specific project.
+        Create many tasks under a specific project in one request.
+
+        The project is checked once, every item is validated on its own, and
+        the valid ones are inserted together: through ``COPY`` on asyncpg for
+        large batches, otherwise through a single multi-row ``executemany``.
+
+        Args:
+            project_id: The project ID to create the tasks under
+            items: Raw task payloads, each shaped like ``TaskCreateModel``
+
+        Returns:
+            The IDs of the created tasks and the errors of rejected items
+
+        Raises:
+            HTTPException: If project not found or the batch is too large
+        """
+        if len(items) > settings.BULK_MAX_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {settings.BULK_MAX_ITEMS} tasks can be created per request"
+            )
+
+        if not await self.project_exists(project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        rows: List[Dict[str, Any]] = []
+        errors: List[TaskBulkErrorModel] = []
+        for index, item in enumerate(items):
+            try:
+                task_data = TaskCreateModel.model_validate(item)
+            except ValidationError as e:
+                errors.append(TaskBulkErrorModel(
+                    index=index,
+                    detail=e.errors(include_url=False, include_context=False)
+                ))
+                continue
+            rows.append({
+                "id": uuid.uuid4(),
+                "title": task_data.title,
+                "priority": task_data.priority,
+                "completed": task_data.completed,
+                "project_id": project_id,
+                "due_date": task_data.due_date,
+            })
+
+        if rows:
+            # Bumped first: this statement opens the transaction (and locks the
+            # project row), so COPY on the raw connection cannot autocommit.
+            await bump_project_versions(self.db, project_id)
+            if (len(rows) >= settings.BULK_COPY_THRESHOLD
+                    and self.db.bind.dialect.driver == "asyncpg"):
+                await self._copy_tasks(rows)
+            else:
+                await self.db.execute(insert(Task.__table__), rows)
+            await publish_task_change(self.db, project_id, "bulk_created", count=len(rows))
+            await self.db.commit()
+            await self.cache.invalidate_project(project_id)
+
+        return TaskBulkResultModel(
+            processed=len(rows),
+            ids=[row["id"] for row in rows],
+            errors=errors
+        )
+
+    async def _copy_tasks(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Stream task rows into the tasks table with asyncpg's binary COPY.
+
+        The COPY bypasses SQLAlchemy, so the session's transaction must
+        already have been begun by an earlier statement.
+        """
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Task.__tablename__,
+            records=[tuple(row[column] for column in TASK_COPY_COLUMNS) for row in rows],
+            columns=list(TASK_COPY_COLUMNS)
+        )
+
+    async def get_tasks_for_project(
+            self,
+            project_id: uuid.UUID,
+            limit: int = 50,
+            cursor: Optional[str] = None,
+            filters: Optional[TaskFilterModel] = None) -> bytes:
+        """
+        Get a page of tasks under a specific project, sorted by priority.
+
+        Pages are addressed with an opaque ``(priority, id)`` cursor, so every
+        page is a bounded range scan on ``ix_tasks_project_id_priority_id``
+        regardless of how deep into the listing it is. Only the ``TaskModel``
+        columns are selected and the page is encoded straight to JSON, so no
+        ORM or Pydantic objects are built per row; encoded pages are read
+        through the cache.
 
         Args:
             project_id: The project ID to get tasks for
+            limit: Maximum number of tasks to return
+            cursor: The ``next_cursor`` of the previous page, if any
+            filters: Optional completion, due date, priority and title filters
 
         Returns:
-            List of tasks for the project
+            The page of tasks and the cursor of the next page, encoded as
+            ``TaskPageModel`` JSON
 
         Raises:
-            HTTPException: If project not found
+            HTTPException: If project not found or the cursor is invalid
         """
-        project = await self.get_project_by_id(project_id)
-        if not project:
+        filter_key = filters.model_dump_json(exclude_none=True) if filters else None
+        cached_page, cache_key = await self.cache.get_task_page(project_id, limit, cursor, filter_key)
+        if cached_page is not None:
+            return cached_page
+
+        if not await self.project_exists(project_id):
             raise HTTPException(status_code=404, detail="Project not found")
 
-        statement = select(Task).where(
-            Task.project_id == project_id).order_by(
-            Task.priority.desc())
+        columns = [getattr(Task, column) for column in TASK_COLUMNS]
+        statement = self._apply_task_filters(
+            select(*columns).where(Task.project_id == project_id), filters)
+        if cursor:
+            last_priority, last_id = self._decode_task_cursor(cursor)
+            statement = statement.where(
+                or_(
+                    Task.priority < last_priority,
+                    and_(Task.priority == last_priority, Task.id > last_id)
+                )
+            )
+        statement = statement.order_by(
+            Task.priority.desc(), Task.id).limit(limit + 1)
+
         result = await self.db.execute(statement)
-        tasks_list = result.scalars().all()
-        return list(tasks_list)
+        tasks_list = [dict(row) for row in result.mappings()]
+
+        next_cursor = None
+        if len(tasks_list) > limit:
+            tasks_list = tasks_list[:limit]
+            last_task = tasks_list[-1]
+            next_cursor = encode_cursor([last_task["priority"], str(last_task["id"])])
+
+        page = dumps({"items": tasks_list, "next_cursor": next_cursor})
+        if self._read_from_primary():
+            await self.cache.set_task_page(cache_key, page)
+        return page
+
+    def _read_from_primary(self) -> bool:
+        """
+        Whether this session's reads came from the primary database.
+
+        A replica can lag behind writes the cache has already been
+        invalidated for, so only primary reads may populate the shared cache.
+        """
+        return self.db.info.get("replica") is None
+
+    @staticmethod
+    def _apply_task_filters(statement, filters: Optional[TaskFilterModel]):
+        """Narrow a task query with the given listing filters."""
+        if filters is None:
+            return statement
+        if filters.completed is not None:
+            statement = statement.where(Task.completed.is_(filters.completed))
+        if filters.due_after is not None:
+            statement = statement.where(Task.due_date >= filters.due_after)
+        if filters.due_before is not None:
+            statement = statement.where(Task.due_date <= filters.due_before)
+        if filters.min_priority is not None:
+            statement = statement.where(Task.priority >= filters.min_priority)
+        if filters.max_priority is not None:
+            statement = statement.where(Task.priority <= filters.max_priority)
+        if filters.q:
+            pattern = filters.q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            statement = statement.where(Task.title.ilike(f"%{pattern}%", escape="\\"))
+        return statement
+
+    @staticmethod
+    def _decode_task_cursor(cursor: str) -> Tuple[int, uuid.UUID]:
+        """Decode a task listing cursor into its ``(priority, id)`` sort key."""
+        priority, task_id = decode_cursor(cursor, 2)
+        try:
+            return int(priority), uuid.UUID(str(task_id))
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async def stream_tasks_for_project(
+            self,
+            project_id: uuid.UUID,
+            filters: Optional[TaskFilterModel] = None,
+            batch_size: int = 1000) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        """
+        Stream every task of a project, sorted by priority, in batches.
+
+        Rows come from a server-side cursor, so only one batch is held in
+        memory at a time. Callers are expected to check that the project
+        exists before they start streaming.
+
+        Args:
+            project_id: The project ID to export tasks for
+            filters: Optional completion, due date, priority and title filters
+            batch_size: Number of rows fetched from the cursor per batch
+
+        Yields:
+            Batches of task rows as column mappings
+        """
+        columns = [getattr(Task, column) for column in TASK_COLUMNS]
+        statement = self._apply_task_filters(
+            select(*columns).where(Task.project_id == project_id), filters).order_by(
+            Task.priority.desc(), Task.id).execution_options(yield_per=batch_size)
+
+        result = await self.db.stream(statement)
+        async for partition in result.mappings().partitions():
+            yield partition
@@ -0,0 +1,134 @@
+"""
+Background purging of soft-deleted projects.
+
+Large projects are soft-deleted on the request path and their tasks are
+removed here in bounded batches, each in its own short transaction, so no
+single statement holds a connection or row locks for long. Once a project
+has no tasks left the project row itself is deleted.
+"""
+import asyncio
+import logging
+import uuid
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select, delete
+
+from app.core.config import settings
+from app.core.db.database import async_session_factory
+from app.models.projects import Project
+from app.models.tasks import Task
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectPurger:
+    """
+    Deletes the tasks of soft-deleted projects in batches.
+
+    Sweeps run every ``interval`` seconds, or immediately after ``wake`` is
+    called. Several workers may purge concurrently; batches skip rows locked
+    by another purger instead of waiting on them.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker,
+            batch_size: int = 5000,
+            interval: float = 60.0):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.interval = interval
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def purge_project(self, project_id: uuid.UUID) -> int:
+        """
+        Delete every task of a soft-deleted project, then the project itself.
+
+        Returns:
+            The number of tasks deleted
+        """
+        deleted = 0
+        while True:
+            batch = select(Task.id).where(
+                Task.project_id == project_id
+            ).limit(self.batch_size).with_for_update(skip_locked=True)
+            async with self.session_factory() as session:
+                result = await session.execute(delete(Task).where(Task.id.in_(batch)))
+                await session.commit()
+            deleted += result.rowcount
+            if result.rowcount < self.batch_size:
+                break
+            # Let request handlers in this worker run between batches.
+            await asyncio.sleep(0)
+
+        # Anything left behind (rows another purger had locked) goes with the cascade.
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(Project).where(Project.id == project_id, Project.deleted_at.is_not(None)))
+            await session.commit()
+        return deleted
+
+    async def purge_once(self) -> int:
+        """
+        Purge every project currently marked deleted.
+
+        Returns:
+            The number of projects purged
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(Project.id).where(Project.deleted_at.is_not(None)).order_by(Project.deleted_at))
+            project_ids = list(result.scalars().all())
+
+        for project_id in project_ids:
+            deleted = await self.purge_project(project_id)
+            logger.info(f"Purged soft-deleted project {project_id} ({deleted} tasks)")
+        return len(project_ids)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge_once()
+            except Exception as e:
+                logger.error(f"Project purge failed: {e!r}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def wake(self) -> None:
+        """Start a sweep now instead of at the next interval."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the background purge loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="project-purger")
+
+    async def stop(self) -> None:
+        """Stop the background purge loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_project_purger: Optional[ProjectPurger] = None
+
+
+def get_project_purger() -> ProjectPurger:
+    """Get the process-wide project purger."""
+    global _project_purger
+    if _project_purger is None:
+        _project_purger = ProjectPurger(
+            async_session_factory,
+            batch_size=settings.PROJECT_PURGE_BATCH_SIZE,
+            interval=settings.PROJECT_PURGE_INTERVAL_SECONDS
+        )
+    return _project_purger
@@ -1,20 +1,30 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 from datetime import datetime
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlmodel import select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, update, delete
 from fastapi import HTTPException
+from pydantic import ValidationError
 
 from app.models.tasks import Task
 from app.models.projects import Project
-from app.schemas.tasks import TaskCreateModel, TaskUpdateModel
+from app.schemas.tasks import (
+    TaskCreateModel, TaskUpdateModel, TaskBulkUpdateItemModel,
+    TaskBulkErrorModel, TaskBulkResultModel
+)
+from app.core.config import settings
+from app.services.cache import ServiceCache, get_service_cache
+from app.core.changefeed import publish_task_change
+from app.services.projects import bump_project_versions
 
 
 class TaskService:
     """Service layer for task operations."""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: Optional[ServiceCache] = None):
         self.db = db
+        self.cache = cache or get_service_cache()
 
     async def update_task(self, task_id: uuid.UUID, task_data: TaskUpdateModel) -> Optional[Task]:
         """
@@ -29,37 +39,135 @@ class TaskService:
             
         Raises:
             Exception: If task update fails
-            ValueError: If project_id is provided but project doesn't exist
+            HTTPException: If project_id is provided but project doesn't exist
         """
-        statement = select(Task).where(Task.id == task_id)
-        result = await self.db.execute(statement)
-        task = result.scalar_one_or_none()
-        
-        if not task:
-            return None
+        values = task_data.model_dump(exclude_none=True)
+        if not values:
+            result = await self.db.execute(select(Task).where(Task.id == task_id))
+            return result.scalar_one_or_none()
 
-        if task_data.project_id is not None:
-            project_statement = select(Project).where(Project.id == task_data.project_id)
-            project_result = await self.db.execute(project_statement)
-            project = project_result.scalar_one_or_none()
-            if not project:
+        previous_project_id = None
+        if "project_id" in values:
+            # Moving a task also invalidates the listing it leaves.
+            result = await self.db.execute(select(Task.project_id).where(Task.id == task_id))
+            previous = result.first()
+            if previous is None:
+                return None
+            previous_project_id = previous.project_id
+            # Soft-deleted projects still satisfy the foreign key.
+            result = await self.db.execute(
+                select(Project.id).where(
+                    Project.id == values["project_id"], Project.deleted_at.is_(None)))
+            if result.scalar_one_or_none() is None:
                 raise HTTPException(status_code=404, detail="Project not found")
-            task.project_id = task_data.project_id
 
-        if task_data.title is not None:
-            task.title = task_data.title
-        if task_data.priority is not None:
-            task.priority = task_data.priority
-        if task_data.completed is not None:
-            task.completed = task_data.completed
-        if task_data.due_date is not None:
-            task.due_date = task_data.due_date
+        statement = update(Task).where(Task.id == task_id).values(
+            **values).returning(Task).execution_options(populate_existing=True)
+        try:
+            result = await self.db.execute(statement)
+        except IntegrityError:
+            # The only constraint on tasks is the project foreign key.
+            await self.db.rollback()
+            raise HTTPException(status_code=404, detail="Project not found")
+        task = result.scalar_one_or_none()
+
+        if not task:
+            await self.db.rollback()
+            return None
+        await bump_project_versions(self.db, task.project_id, previous_project_id)
+        if previous_project_id is not None and previous_project_id != task.project_id:
+            # Moved: it leaves one listing and joins another.
+            await publish_task_change(self.db, previous_project_id, "deleted", task_id=task.id)
+            await publish_task_change(self.db, task.project_id, "created", task_id=task.id)
+        else:
+            await publish_task_change(self.db, task.project_id, "updated", task_id=task.id)
 
         await self.db.commit()
-        await self.db.refresh(task)
-        
+        await self.cache.invalidate_project(task.project_id, previous_project_id)
+
         return task
     
+    async def update_tasks(self, items: List[Dict[str, Any]]) -> TaskBulkResultModel:
+        """
+        Update many tasks in one request.
+
+        Items are validated on their own; unknown tasks and unknown target
+        projects are looked up with one query each and reported per item. The
+        remaining updates are applied as one executemany by primary key.
+
+        Args:
+            items: Raw update payloads, each shaped like ``TaskUpdateModel`` plus ``id``
+
+        Returns:
+            The IDs of the updated tasks and the errors of rejected items
+
+        Raises:
+            HTTPException: If the batch is too large
+        """
+        if len(items) > settings.BULK_MAX_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {settings.BULK_MAX_ITEMS} tasks can be updated per request"
+            )
+
+        updates: Dict[int, TaskBulkUpdateItemModel] = {}
+        errors: List[TaskBulkErrorModel] = []
+        for index, item in enumerate(items):
+            try:
+                updates[index] = TaskBulkUpdateItemModel.model_validate(item)
+            except ValidationError as e:
+                errors.append(TaskBulkErrorModel(
+                    index=index,
+                    detail=e.errors(include_url=False, include_context=False)
+                ))
+
+        task_ids = {update_data.id for update_data in updates.values()}
+        project_ids = {
+            update_data.project_id for update_data in updates.values()
+            if update_data.project_id is not None
+        }
+        existing_tasks: Dict[uuid.UUID, Optional[uuid.UUID]] = {}
+        if task_ids:
+            result = await self.db.execute(
+                select(Task.id, Task.project_id).where(Task.id.in_(task_ids)))
+            existing_tasks = dict(result.tuples().all())
+        existing_projects = set()
+        if project_ids:
+            result = await self.db.execute(
+                select(Project.id).where(Project.id.in_(project_ids), Project.deleted_at.is_(None)))
+            existing_projects = set(result.scalars().all())
+
+        rows: List[Dict[str, Any]] = []
+        for index, update_data in updates.items():
+            if update_data.id not in existing_tasks:
+                errors.append(TaskBulkErrorModel(index=index, detail="Task not found"))
+                continue
+            if update_data.project_id is not None and update_data.project_id not in existing_projects:
+                errors.append(TaskBulkErrorModel(index=index, detail="Project not found"))
+                continue
+            values = update_data.model_dump(exclude_none=True)
+            if len(values) > 1:
+                rows.append(values)
+
+        if rows:
+            affected_projects = [
+                *(existing_tasks[row["id"]] for row in rows),
+                *(row.get("project_id") for row in rows)
+            ]
+            await self.db.execute(update(Task), rows)
+            await bump_project_versions(self.db, *affected_projects)
+            for project_id in {project_id for project_id in affected_projects if project_id is not None}:
+                await publish_task_change(self.db, project_id, "bulk_updated")
+            await self.db.commit()
+            await self.cache.invalidate_project(*affected_projects)
+
+        errors.sort(key=lambda error: error.index)
+        return TaskBulkResultModel(
+            processed=len(rows),
+            ids=[row["id"] for row in rows],
+            errors=errors
+        )
+
     async def delete_task(self, task_id: uuid.UUID) -> bool:
         """
         Delete a task by its ID.
@@ -73,14 +181,15 @@ class TaskService:
         Raises:
             Exception: If task deletion fails
         """
-        statement = select(Task).where(Task.id == task_id)
+        statement = delete(Task).where(Task.id == task_id).returning(Task.project_id)
         result = await self.db.execute(statement)
-        task = result.scalar_one_or_none()
-        
-        if not task:
-            return False
+        deleted = result.one_or_none()
+        if deleted is not None:
+            await bump_project_versions(self.db, deleted.project_id)
+            await publish_task_change(self.db, deleted.project_id, "deleted", task_id=task_id)
 
-        await self.db.delete(task)
         await self.db.commit()
+        if deleted is not None:
+            await self.cache.invalidate_project(deleted.project_id)
         
-        return True
+        return deleted is not None
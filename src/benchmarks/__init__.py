@@ -0,0 +1,3 @@
+"""
+Benchmark tooling for the Taller Challenge API.
+"""
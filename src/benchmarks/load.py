@@ -0,0 +1,376 @@
+"""
+Load-test harness for the Taller Challenge API.
+
+Drives every v1 route except the long-lived task event stream (auth, project
+CRUD and stats, task create/list/update/delete, bulk writes and export) at a
+fixed concurrency, reports p50/p95/p99 latency and requests per second
+per route, and saves the results as JSON so runs can be compared.
+
+Usage (from ``src/``, against a running server):
+    python -m benchmarks.load --base-url http://localhost:8000 \
+        --requests 2000 --concurrency 50 --seed-file seeded.json \
+        --output results.json --compare previous.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+API_PREFIX = "/api/v1"
+
+# Items per bulk request and projects per batched stats lookup.
+BATCH_SIZE = 20
+
+Scenario = Callable[[httpx.AsyncClient, "Context"], Awaitable[httpx.Response]]
+
+
+class Context:
+    """State shared between scenarios: the auth token and the IDs they act on."""
+
+    def __init__(self, username: str, password: str, seeded_projects: List[str]):
+        self.username = username
+        self.password = password
+        self.token = ""
+        self.seeded_projects = seeded_projects
+        self.created_projects: List[str] = []
+        self.created_tasks: List[str] = []
+        self.rng = random.Random(0)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def project_pool(self) -> List[str]:
+        return self.seeded_projects or self.created_projects
+
+    def any_project(self) -> str:
+        return self.rng.choice(self.project_pool())
+
+
+async def login(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.post(
+        f"{API_PREFIX}/auth/login",
+        json={"username": ctx.username, "password": ctx.password}
+    )
+
+
+async def me(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.get(f"{API_PREFIX}/auth/me", headers=ctx.headers)
+
+
+async def create_project(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    response = await client.post(
+        f"{API_PREFIX}/projects/",
+        json={"name": "Load test project", "description": "Created by benchmarks.load"},
+        headers=ctx.headers
+    )
+    if response.status_code == 201:
+        ctx.created_projects.append(response.json()["id"])
+    return response
+
+
+async def list_projects(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.get(f"{API_PREFIX}/projects/", params={"limit": 50}, headers=ctx.headers)
+
+
+async def get_project(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.get(f"{API_PREFIX}/projects/{ctx.any_project()}", headers=ctx.headers)
+
+
+async def project_stats(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.get(f"{API_PREFIX}/projects/{ctx.any_project()}/stats", headers=ctx.headers)
+
+
+async def projects_stats(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    pool = ctx.project_pool()
+    return await client.get(
+        f"{API_PREFIX}/projects/stats",
+        params={"project_id": ctx.rng.sample(pool, min(BATCH_SIZE, len(pool)))},
+        headers=ctx.headers
+    )
+
+
+async def update_project(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    project_id = ctx.rng.choice(ctx.created_projects)
+    return await client.put(
+        f"{API_PREFIX}/projects/{project_id}",
+        json={"description": f"Updated at {time.time()}"},
+        headers=ctx.headers
+    )
+
+
+async def create_task(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    project_id = ctx.rng.choice(ctx.created_projects)
+    response = await client.post(
+        f"{API_PREFIX}/projects/{project_id}/tasks/",
+        json={"title": "Load test task", "priority": ctx.rng.randint(1, 10)},
+        headers=ctx.headers
+    )
+    if response.status_code == 201:
+        ctx.created_tasks.append(response.json()["id"])
+    return response
+
+
+async def bulk_create_tasks(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    project_id = ctx.rng.choice(ctx.created_projects)
+    response = await client.post(
+        f"{API_PREFIX}/projects/{project_id}/tasks/bulk",
+        json={"tasks": [
+            {"title": f"Load test task {i}", "priority": ctx.rng.randint(1, 10)}
+            for i in range(BATCH_SIZE)
+        ]},
+        headers=ctx.headers
+    )
+    if response.status_code == 201:
+        ctx.created_tasks.extend(response.json()["ids"])
+    return response
+
+
+async def list_tasks(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.get(
+        f"{API_PREFIX}/projects/{ctx.any_project()}/tasks/",
+        params={"limit": 50},
+        headers=ctx.headers
+    )
+
+
+async def export_tasks(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.get(
+        f"{API_PREFIX}/projects/{ctx.any_project()}/tasks/export",
+        params={"format": "ndjson"},
+        headers=ctx.headers
+    )
+
+
+async def update_task(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    task_id = ctx.rng.choice(ctx.created_tasks)
+    return await client.put(
+        f"{API_PREFIX}/tasks/{task_id}",
+        json={"completed": True, "priority": ctx.rng.randint(1, 10)},
+        headers=ctx.headers
+    )
+
+
+async def bulk_update_tasks(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    task_ids = ctx.rng.sample(ctx.created_tasks, min(BATCH_SIZE, len(ctx.created_tasks)))
+    return await client.put(
+        f"{API_PREFIX}/tasks/bulk",
+        json={"tasks": [
+            {"id": task_id, "completed": True, "priority": ctx.rng.randint(1, 10)}
+            for task_id in task_ids
+        ]},
+        headers=ctx.headers
+    )
+
+
+async def delete_task(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.delete(f"{API_PREFIX}/tasks/{ctx.created_tasks.pop()}", headers=ctx.headers)
+
+
+async def delete_project(client: httpx.AsyncClient, ctx: Context) -> httpx.Response:
+    return await client.delete(f"{API_PREFIX}/projects/{ctx.created_projects.pop()}", headers=ctx.headers)
+
+
+# Run in this order: later scenarios consume what earlier ones create.
+SCENARIOS: Dict[str, Scenario] = {
+    "login": login,
+    "me": me,
+    "create_project": create_project,
+    "list_projects": list_projects,
+    "get_project": get_project,
+    "project_stats": project_stats,
+    "projects_stats": projects_stats,
+    "update_project": update_project,
+    "create_task": create_task,
+    "bulk_create_tasks": bulk_create_tasks,
+    "list_tasks": list_tasks,
+    "export_tasks": export_tasks,
+    "update_task": update_task,
+    "bulk_update_tasks": bulk_update_tasks,
+    "delete_task": delete_task,
+    "delete_project": delete_project,
+}
+
+# Consuming scenarios cannot issue more requests than there are items left.
+CONSUMERS = {
+    "delete_task": lambda ctx: len(ctx.created_tasks),
+    "delete_project": lambda ctx: len(ctx.created_projects),
+}
+
+# Scenarios acting on existing items are skipped when there are none to act on,
+# e.g. when the scenarios that create them were not selected.
+PREREQUISITES = {
+    "get_project": lambda ctx: ctx.project_pool(),
+    "project_stats": lambda ctx: ctx.project_pool(),
+    "projects_stats": lambda ctx: ctx.project_pool(),
+    "update_project": lambda ctx: ctx.created_projects,
+    "create_task": lambda ctx: ctx.created_projects,
+    "bulk_create_tasks": lambda ctx: ctx.created_projects,
+    "list_tasks": lambda ctx: ctx.project_pool(),
+    "export_tasks": lambda ctx: ctx.project_pool(),
+    "update_task": lambda ctx: ctx.created_tasks,
+    "bulk_update_tasks": lambda ctx: ctx.created_tasks,
+}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def run_scenario(client: httpx.AsyncClient, ctx: Context, scenario: Scenario,
+                       requests: int, concurrency: int) -> Dict[str, Any]:
+    """Issue ``requests`` calls of one scenario from ``concurrency`` workers."""
+    latencies: List[float] = []
+    status_codes: Dict[str, int] = {}
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await scenario(client, ctx)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            code = str(response.status_code)
+            status_codes[code] = status_codes.get(code, 0) + 1
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    to_ms = 1000.0
+    return {
+        "requests": requests,
+        "errors": errors,
+        "status_codes": status_codes,
+        "elapsed_seconds": elapsed,
+        "rps": requests / elapsed if elapsed else 0.0,
+        "mean_ms": sum(latencies) / len(latencies) * to_ms if latencies else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * to_ms,
+        "p95_ms": percentile(latencies, 0.95) * to_ms,
+        "p99_ms": percentile(latencies, 0.99) * to_ms,
+        "max_ms": latencies[-1] * to_ms if latencies else 0.0,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    header = f"{'scenario':<20}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    if baseline:
+        header += f"{'Δrps':>10}{'Δp95':>10}"
+    print(header)
+    for name, stats in results["scenarios"].items():
+        line = (
+            f"{name:<20}{stats['rps']:>10.1f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['errors']:>8}"
+        )
+        previous = (baseline or {}).get("scenarios", {}).get(name)
+        if previous:
+            rps_delta = (stats["rps"] / previous["rps"] - 1) * 100 if previous["rps"] else 0.0
+            p95_delta = (stats["p95_ms"] / previous["p95_ms"] - 1) * 100 if previous["p95_ms"] else 0.0
+            line += f"{rps_delta:>+9.1f}%{p95_delta:>+9.1f}%"
+        print(line)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    seeded_projects: List[str] = []
+    if args.seed_file:
+        with open(args.seed_file) as f:
+            seeded_projects = [project["id"] for project in json.load(f)["projects"]]
+
+    ctx = Context(args.username, args.password, seeded_projects)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        response = await login(client, ctx)
+        response.raise_for_status()
+        ctx.token = response.json()["access_token"]
+
+        selected = args.scenarios or list(SCENARIOS)
+        scenarios: Dict[str, Any] = {}
+        for name in SCENARIOS:
+            if name not in selected:
+                continue
+            if name in PREREQUISITES and not PREREQUISITES[name](ctx):
+                print(f"  {name}: skipped, nothing to act on")
+                continue
+            requests = args.login_requests if name == "login" else args.requests
+            if name in CONSUMERS:
+                requests = min(requests, CONSUMERS[name](ctx))
+            if requests <= 0:
+                continue
+            scenarios[name] = await run_scenario(
+                client, ctx, SCENARIOS[name], requests, args.concurrency
+            )
+            print(f"  {name}: {scenarios[name]['rps']:.1f} req/s")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "seeded_projects": len(seeded_projects),
+        },
+        "scenarios": scenarios,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="1234")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=100, help="Requests for the (bcrypt-bound) login scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed-file", help="Output of benchmarks.seed; read scenarios use its projects")
+    parser.add_argument("--scenarios", nargs="*", choices=list(SCENARIOS), help="Subset of scenarios to run")
+    parser.add_argument("--output", default="results.json", help="Where to save this run's results")
+    parser.add_argument("--compare", help="Previous results file to compare against")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Seed the database with N projects x M tasks for benchmarking.
+
+Priorities are skewed towards low values (most tasks are routine, few are
+urgent), a share of tasks has no due date, and the rest are spread around
+today. Project sizes can optionally follow a long-tailed distribution so a
+few projects are much larger than the rest.
+
+Usage (from ``src/``):
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.seed \
+        --projects 100 --tasks-per-project 1000 --output seeded.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from sqlmodel import insert
+
+from app.core.db.database import engine, initialize_database
+from app.models.projects import Project
+from app.models.tasks import Task
+
+# Relative weights of priorities 1..10.
+PRIORITY_WEIGHTS = [30, 22, 15, 10, 8, 6, 4, 2.5, 1.5, 1]
+
+
+def generate_project(index: int, rng: random.Random) -> Dict[str, Any]:
+    """Build one project row."""
+    created_at = datetime.now(timezone.utc) - timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+    return {
+        "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+        "name": f"Benchmark Project {index}",
+        "description": f"Seeded project {index} for benchmarking",
+        "created_at": created_at,
+    }
+
+
+def generate_task(project_id: uuid.UUID, index: int, rng: random.Random,
+                  no_due_date_ratio: float) -> Dict[str, Any]:
+    """Build one task row with a realistic priority and due date."""
+    due_date = None
+    if rng.random() >= no_due_date_ratio:
+        due_date = date.today() + timedelta(days=round(rng.gauss(7, 21)))
+    return {
+        "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+        "project_id": project_id,
+        "title": f"Task {index}",
+        "priority": rng.choices(range(1, 11), weights=PRIORITY_WEIGHTS)[0],
+        "completed": rng.random() < 0.35,
+        "due_date": due_date,
+    }
+
+
+def project_sizes(projects: int, tasks_per_project: int, long_tail: bool,
+                  rng: random.Random) -> List[int]:
+    """Task count of every project; the total stays close to projects x tasks_per_project."""
+    if not long_tail:
+        return [tasks_per_project] * projects
+    weights = [rng.paretovariate(1.2) for _ in range(projects)]
+    total_weight = sum(weights)
+    return [max(1, round(projects * tasks_per_project * weight / total_weight)) for weight in weights]
+
+
+async def seed(args: argparse.Namespace) -> Dict[str, Any]:
+    """Create the schema if needed and insert the generated rows in batches."""
+    rng = random.Random(args.seed)
+    await initialize_database()
+
+    started = time.perf_counter()
+    projects = [generate_project(index, rng) for index in range(args.projects)]
+    sizes = project_sizes(args.projects, args.tasks_per_project, args.long_tail, rng)
+
+    async with engine.begin() as conn:
+        await conn.execute(insert(Project.__table__), projects)
+
+    total_tasks = 0
+    batch: List[Dict[str, Any]] = []
+    for project, size in zip(projects, sizes):
+        for index in range(size):
+            batch.append(generate_task(project["id"], index, rng, args.no_due_date_ratio))
+            if len(batch) >= args.batch_size:
+                async with engine.begin() as conn:
+                    await conn.execute(insert(Task.__table__), batch)
+                total_tasks += len(batch)
+                batch = []
+    if batch:
+        async with engine.begin() as conn:
+            await conn.execute(insert(Task.__table__), batch)
+        total_tasks += len(batch)
+
+    await engine.dispose()
+
+    return {
+        "projects": [
+            {"id": str(project["id"]), "tasks": size}
+            for project, size in zip(projects, sizes)
+        ],
+        "total_tasks": total_tasks,
+        "seed": args.seed,
+        "elapsed_seconds": time.perf_counter() - started,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=100, help="Number of projects to create")
+    parser.add_argument("--tasks-per-project", type=int, default=1000, help="Average tasks per project")
+    parser.add_argument("--long-tail", action="store_true", help="Use long-tailed project sizes")
+    parser.add_argument("--no-due-date-ratio", type=float, default=0.2, help="Share of tasks without a due date")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per INSERT batch")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible data")
+    parser.add_argument("--output", default="seeded.json", help="Where to write the seeded project IDs")
+    args = parser.parse_args()
+
+    summary = asyncio.run(seed(args))
+    with open(args.output, "w") as f:
+        json.dump(summary, f, indent=2)
+    print(
+        f"Seeded {len(summary['projects'])} projects and {summary['total_tasks']} tasks "
+        f"in {summary['elapsed_seconds']:.1f}s -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""
+Test configuration for the Taller Challenge API.
+
+Run from ``src/`` with ``python -m pytest``. Tests use ``DATABASE_URL`` when
+it is set (point it at PostgreSQL to exercise the asyncpg-only paths) and a
+throwaway SQLite database otherwise.
+"""
+import os
+import tempfile
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+)
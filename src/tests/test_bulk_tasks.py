@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+from sqlmodel import func, select
+
+from app.core.config import settings
+from app.core.db.database import async_session_factory, engine, ensure_schema
+from app.models.projects import Project
+from app.models.tasks import Task
+from app.schemas.projects import ProjectCreateModel
+from app.services import projects as project_services
+from app.services.projects import ProjectService
+
+
+def test_bulk_create_persists_nothing_when_a_later_step_fails(monkeypatch):
+    async def fail_publish(*args, **kwargs):
+        raise RuntimeError("publish failed")
+
+    async def scenario():
+        await ensure_schema()
+        async with async_session_factory() as session:
+            service = ProjectService(session)
+            project = await service.create_project(
+                ProjectCreateModel(name="Bulk", description="Atomicity"))
+            # Warm the cache so the existence check issues no statement: the
+            # insert must not be the first thing to touch the connection.
+            assert await service.project_exists(project.id)
+
+        # Every batch takes the COPY path on asyncpg.
+        monkeypatch.setattr(settings, "BULK_COPY_THRESHOLD", 1)
+        monkeypatch.setattr(project_services, "publish_task_change", fail_publish)
+        async with async_session_factory() as session:
+            with pytest.raises(RuntimeError):
+                await ProjectService(session).create_tasks_for_project(
+                    project.id, [{"title": f"Task {i}", "priority": i} for i in range(3)])
+
+        async with async_session_factory() as session:
+            task_count = await session.scalar(
+                select(func.count()).select_from(Task).where(Task.project_id == project.id))
+            version = await session.scalar(
+                select(Project.version).where(Project.id == project.id))
+        await engine.dispose()
+        return task_count, version, project.version
+
+    task_count, version, initial_version = asyncio.run(scenario())
+    assert task_count == 0
+    assert version == initial_version